@@ -49,42 +49,292 @@ except ModuleNotFoundError:
         audioop_module.maxpp = lambda *args: 0
         sys.modules['audioop'] = audioop_module
 
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, g
 from flask_cors import CORS
 import sqlite3
 import json
 import os
 import re
-import difflib
 from datetime import datetime
-from functools import wraps
+from functools import lru_cache, wraps
+from contextlib import ExitStack, contextmanager
 import random
+import queue
+import atexit
 import speech_recognition as sr
 from gtts import gTTS
+from gtts.tts import gTTSError
+import requests
+from requests.adapters import HTTPAdapter
+import urllib.request
 import base64
+import csv
 import io
 import tempfile
 
+# Optional orjson (C, UTF-8 native) for the raw_answers column; stdlib json is the fallback
+try:
+    import orjson
+
+    def _dump_answers(answers):
+        # OPT_NON_STR_KEYS: stringify int keys as json.dumps does
+        return orjson.dumps(answers, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    _load_answers = orjson.loads
+except ImportError:
+    def _dump_answers(answers):
+        return json.dumps(answers, ensure_ascii=False)
+
+    _load_answers = json.loads
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'transcripts.db')
 
+# Bump when init_db() gains a migration; stored in PRAGMA user_version.
+# main.py migrates the same DB file to a superset of this schema (version 2)
+# that also holds its transcripts table, so this must stay below main.py's
+SCHEMA_VERSION = 1
+
+# Precompiled format checks for the auth endpoints
+_PHONE_RE = re.compile(r'\d{10}')
+_OTP_RE = re.compile(r'\d{4}')
+# Base64 audio payload in a gTTS batchexecute response line
+_TTS_AUDIO_RE = re.compile(r'jQ1olc","\[\\"(.*)\\"]')
+
+# Shared HTTP session for gTTS so TCP/TLS connections are reused across calls
+_TTS_SESSION = requests.Session()
+_TTS_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+class PooledGTTS(gTTS):
+    """gTTS that sends its requests through the shared _TTS_SESSION.
+    gTTS.stream() opens and closes a new Session per call and has no public
+    way to pass one in, so this copies its loop from gTTS==2.5.1 (the version
+    pinned in requirements.txt), minus verify=False. Re-check it against
+    gTTS.stream() and _prepare_requests() whenever that pin changes.
+    """
+    def stream(self):
+        for pr in self._prepare_requests():
+            try:
+                r = _TTS_SESSION.send(
+                    request=pr,
+                    proxies=urllib.request.getproxies(),
+                    timeout=self.timeout,
+                )
+                r.raise_for_status()
+            except requests.exceptions.HTTPError:
+                raise gTTSError(tts=self, response=r)
+            except requests.exceptions.RequestException:
+                raise gTTSError(tts=self)
+
+            for line in r.iter_lines(chunk_size=1024):
+                decoded_line = line.decode('utf-8')
+                if 'jQ1olc' in decoded_line:
+                    audio_search = _TTS_AUDIO_RE.search(decoded_line)
+                    if not audio_search:
+                        raise gTTSError(tts=self, response=r)
+                    yield base64.b64decode(audio_search.group(1).encode('ascii'))
+
+@lru_cache(maxsize=64)
+def tts_base64(text, lang):
+    """Synthesize text with gTTS and return the MP3 as a base64 string.
+    Only fixed question prompts are spoken, so each is synthesized once per process.
+    """
+    audio_buffer = io.BytesIO()
+    PooledGTTS(text=text, lang=lang, slow=False).write_to_fp(audio_buffer)
+    return base64.b64encode(audio_buffer.getvalue()).decode('utf-8')
+
+# SQL shared by several endpoints, kept as constants so each copy stays in sync
+_SQL_SET_USER_CHOICE = 'UPDATE workers SET user_choice = ? WHERE phone_number = ?'
+_SQL_INSERT_USER_CHOICE = '''INSERT INTO workers (timestamp, phone_number, user_choice, profile_created)
+                             VALUES (?, ?, ?, 0)'''
+_SQL_SELECT_RAW_ANSWERS = 'SELECT raw_answers FROM workers WHERE phone_number = ?'
+_SQL_UPDATE_RAW_ANSWERS = 'UPDATE workers SET raw_answers = ? WHERE phone_number = ?'
+_SQL_INSERT_RAW_ANSWERS = '''INSERT INTO workers (timestamp, phone_number, raw_answers, profile_created)
+                             VALUES (?, ?, ?, 0)'''
+
+# Onboarding answer keys, in workers column order
+_ANSWER_FIELDS = ('name', 'skill', 'education', 'age', 'sex', 'experience',
+                  'location', 'aadhaar', 'wage_expected', 'languages_known')
+_SQL_UPDATE_ONBOARDED = '''UPDATE workers SET
+    timestamp = ?, profile_created = 1, name = ?, skill = ?, education = ?, age = ?,
+    sex = ?, experience = ?, location = ?, aadhaar = ?, wage_expected = ?,
+    languages_known = ?, raw_answers = ?
+    WHERE id = ?'''
+_SQL_INSERT_ONBOARDED = '''INSERT INTO workers
+    (timestamp, phone_number, profile_created, name, skill, education, age, sex,
+     experience, location, aadhaar, wage_expected, languages_known, raw_answers)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)'''
+
+# Columns returned by the profile and admin listing endpoints
+_PROFILE_COLUMNS = '''id, phone_number, name, skill, education, age, sex, experience,
+    location, aadhaar, wage_expected, languages_known, profile_created, timestamp'''
+_SQL_SELECT_PROFILE = f'SELECT {_PROFILE_COLUMNS} FROM workers WHERE phone_number = ?'
+_SQL_LIST_WORKERS = f'SELECT {_PROFILE_COLUMNS} FROM workers ORDER BY id DESC LIMIT ? OFFSET ?'
+_SQL_SEARCH_WORKERS = f'''SELECT {_PROFILE_COLUMNS} FROM workers
+    WHERE name LIKE ? OR phone_number LIKE ? OR skill LIKE ?
+    ORDER BY id DESC LIMIT ? OFFSET ?'''
+
+# Columns of the admin CSV export, in file order
+_EXPORT_COLUMNS = ('id', 'timestamp', 'phone_number', 'name', 'skill', 'education', 'age',
+                   'sex', 'experience', 'location', 'aadhaar', 'wage_expected',
+                   'languages_known', 'raw_answers')
+_SQL_EXPORT_WORKERS = f"SELECT {', '.join(_EXPORT_COLUMNS)} FROM workers ORDER BY id"
+
+# User-choice keywords, matched as substrings of the lower-cased answer.
+# The text endpoint uses the English lists; voice adds Hindi/transliterated ones
+_APPLY_KEYWORDS_EN = ('apply', 'job', 'apply job', 'apply for job', 'find job', 'search job')
+_POST_KEYWORDS_EN = ('post', 'post job', 'create job', 'add job', 'list job')
+_LEARNING_KEYWORDS_EN = ('learn', 'learning', 'learning module', 'education', 'course', 'training')
+_APPLY_KEYWORDS = _APPLY_KEYWORDS_EN + ('अप्लाई', 'जॉब', 'नौकरी', 'काम', 'खोज', 'ढूंढ')
+_POST_KEYWORDS = _POST_KEYWORDS_EN + ('पोस्ट', 'नौकरी देना', 'भर्ती', 'विज्ञापन')
+_LEARNING_KEYWORDS = _LEARNING_KEYWORDS_EN + (
+    'study',
+    'सीखना', 'सीख', 'शिक्षा', 'पढ़ाई', 'पढ़ना', 'ट्रेनिंग', 'प्रशिक्षण',
+    'कोर्स', 'मॉड्यूल', 'लर्निंग', 'एजुकेशन', 'ज्ञान', 'अध्ययन',
+    'seekh', 'padhai', 'training', 'module'
+)
+_MODULE_KEYWORDS = ('learning module', 'लर्निंग मॉड्यूल', 'module', 'मॉड्यूल')
+_POST_MARKERS = ('post', 'पोस्ट')
+
+def _keyword_re(keywords):
+    """One alternation per keyword list, so a single search() scans the text once"""
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+_APPLY_EN_RE = _keyword_re(_APPLY_KEYWORDS_EN)
+_POST_EN_RE = _keyword_re(_POST_KEYWORDS_EN)
+_LEARNING_EN_RE = _keyword_re(_LEARNING_KEYWORDS_EN)
+_APPLY_RE = _keyword_re(_APPLY_KEYWORDS)
+_POST_RE = _keyword_re(_POST_KEYWORDS)
+_LEARNING_RE = _keyword_re(_LEARNING_KEYWORDS)
+_MODULE_RE = _keyword_re(_MODULE_KEYWORDS)
+_POST_MARKER_RE = _keyword_re(_POST_MARKERS)
+
+# User-choice question prompt, keyed by language
+_USER_CHOICE_QUESTIONS = {
+    'en': 'What would you like to do? Say apply job, post job, or learning module.',
+    'hi': 'आप क्या करना चाहेंगे? कहें apply job, post job, या learning module।'
+}
+
+# Onboarding questions as listed by /api/onboarding/questions
+_ONBOARDING_QUESTIONS = (
+    {'key': 'name', 'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
+    {'key': 'skill', 'en': 'What is your skill? (eg: plumber, painter)', 'hi': 'आपका कौशल क्या है? (जैसे: पलंबर, पेंटर)'},
+    {'key': 'education', 'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
+    {'key': 'age', 'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
+    {'key': 'sex', 'en': 'What is your sex? (male/female)', 'hi': 'आपका लिंग क्या है? (पुरुष/महिला)'},
+    {'key': 'experience', 'en': 'How many years of experience?', 'hi': 'अनुभव के वर्षों की संख्या क्या है?'},
+    {'key': 'location', 'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
+    {'key': 'wage_expected', 'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
+    {'key': 'languages_known', 'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
+)
+
+# Voice prompt text per onboarding question (/api/onboarding/question/<key>)
+_QUESTION_VOICE_TEXT = {
+    'name': {'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
+    'skill': {'en': 'What is your skill? For example, plumber, painter, electrician?', 'hi': 'आपका कौशल क्या है? जैसे: पलंबर, पेंटर, इलेक्ट्रीशियन?'},
+    'education': {'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
+    'age': {'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
+    'sex': {'en': 'What is your sex? Male or female?', 'hi': 'आपका लिंग क्या है? पुरुष या महिला?'},
+    'experience': {'en': 'How many years of experience do you have?', 'hi': 'आपको कितने वर्षों का अनुभव है?'},
+    'location': {'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
+    'wage_expected': {'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
+    'languages_known': {'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
+}
+
 # Simple token storage (use JWT in production)
 tokens = {}  # {phone_number: token}
 
-def get_db_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
+# Idle connections kept open between requests
+DB_POOL_SIZE = 8
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+def open_db_connection():
+    """Open a new database connection in WAL mode"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # WAL lets readers run alongside a writer and needs fewer fsyncs per commit
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-20000')
     return conn
 
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the pool; on exit discard uncommitted work and return it"""
+    try:
+        conn = _db_pool.get_nowait()
+    except queue.Empty:
+        conn = open_db_connection()
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            _db_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+def get_db_connection():
+    """Get the database connection for the current request (from the pool)"""
+    if 'db' not in g:
+        g.db_scope = ExitStack()
+        g.db = g.db_scope.enter_context(pooled_connection())
+    return g.db
+
+@app.teardown_appcontext
+def release_db_connection(exc):
+    """Return the request's connection to the pool"""
+    g.pop('db', None)
+    scope = g.pop('db_scope', None)
+    if scope is not None:
+        scope.close()
+
+def _merge_raw_answers(conn, phone, updates):
+    """Merge updates into the worker's raw_answers, creating the row if needed.
+    The caller commits.
+    """
+    c = conn.cursor()
+    c.execute(_SQL_SELECT_RAW_ANSWERS, (phone,))
+    result = c.fetchone()
+    
+    if result and result['raw_answers']:
+        answers = _load_answers(result['raw_answers'])
+    else:
+        answers = {}
+    answers.update(updates)
+    
+    if result:
+        c.execute(_SQL_UPDATE_RAW_ANSWERS, (_dump_answers(answers), phone))
+    else:
+        ts = datetime.utcnow().isoformat()
+        c.execute(_SQL_INSERT_RAW_ANSWERS, (ts, phone, _dump_answers(answers)))
+    return answers
+
+@atexit.register
+def close_db_pool():
+    """Close idle pooled connections at interpreter exit (checkpoints the WAL)"""
+    while True:
+        try:
+            _db_pool.get_nowait().close()
+        except queue.Empty:
+            break
+
 def init_db():
     """Initialize database tables"""
-    conn = get_db_connection()
+    conn = open_db_connection()
     c = conn.cursor()
     
+    # Skip table introspection once the schema has been migrated
+    c.execute('PRAGMA user_version')
+    if c.fetchone()[0] >= SCHEMA_VERSION:
+        conn.close()
+        return
+    
     # Create workers table if not exists
     c.execute('''
         CREATE TABLE IF NOT EXISTS workers (
@@ -120,9 +370,21 @@ def init_db():
     if 'user_choice' not in columns:
         c.execute("ALTER TABLE workers ADD COLUMN user_choice TEXT")
     
+    # Every endpoint looks workers up by phone_number; index it as main.py does
+    try:
+        c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_workers_phone ON workers(phone_number)")
+    except sqlite3.IntegrityError:
+        c.execute("CREATE INDEX IF NOT EXISTS idx_workers_phone ON workers(phone_number)")
+    
+    c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
     conn.commit()
     conn.close()
 
+# WSGI servers (gunicorn, uWSGI) never reach __main__; run the schema
+# migration from one process per deploy with RUN_MIGRATIONS=1
+if os.environ.get('RUN_MIGRATIONS'):
+    init_db()
+
 def require_auth(f):
     """Decorator to require authentication"""
     @wraps(f)
@@ -150,13 +412,13 @@ def verify_otp():
     phone = data.get('phone_number', '').strip()
     otp = data.get('otp', '').strip()
     
-    if not phone or len(phone) != 10 or not phone.isdigit():
+    if not _PHONE_RE.fullmatch(phone):
         return jsonify({
             'success': False,
             'message': 'Invalid phone number format'
         }), 400
     
-    if not otp or len(otp) != 4 or not otp.isdigit():
+    if not _OTP_RE.fullmatch(otp):
         return jsonify({
             'success': False,
             'message': 'Invalid OTP format. Must be 4 digits.'
@@ -168,7 +430,6 @@ def verify_otp():
     c = conn.cursor()
     c.execute('SELECT profile_created, user_choice FROM workers WHERE phone_number = ?', (phone,))
     result = c.fetchone()
-    conn.close()
     
     # Determine onboarding status
     onboarding_completed = result is not None and result[0] == 1
@@ -199,7 +460,6 @@ def check_profile(phone_number):
     c = conn.cursor()
     c.execute('SELECT profile_created FROM workers WHERE phone_number = ?', (phone_number,))
     result = c.fetchone()
-    conn.close()
     
     profile_exists = result is not None and result[0] == 1
     
@@ -229,22 +489,11 @@ def get_user_choice_question():
     """Get the user choice question text for TTS"""
     language = request.args.get('language', 'en')
     
-    questions = {
-        'en': 'What would you like to do? Say apply job, post job, or learning module.',
-        'hi': 'आप क्या करना चाहेंगे? कहें apply job, post job, या learning module।'
-    }
-    
-    question_text = questions.get(language, questions['en'])
+    question_text = _USER_CHOICE_QUESTIONS.get(language, _USER_CHOICE_QUESTIONS['en'])
     
     # Generate TTS audio
     try:
-        tts = gTTS(text=question_text, lang='en' if language == 'en' else 'hi', slow=False)
-        audio_buffer = io.BytesIO()
-        tts.write_to_fp(audio_buffer)
-        audio_buffer.seek(0)
-        
-        # Convert to base64 for JSON response
-        audio_base64 = base64.b64encode(audio_buffer.read()).decode('utf-8')
+        audio_base64 = tts_base64(question_text, 'en' if language == 'en' else 'hi')
         
         return jsonify({
             'success': True,
@@ -279,24 +528,19 @@ def save_user_choice():
         }), 400
     
     # Process voice text to determine choice
-    # Keywords for each choice
-    apply_keywords = ['apply', 'job', 'apply job', 'apply for job', 'find job', 'search job']
-    post_keywords = ['post', 'post job', 'create job', 'add job', 'list job']
-    learning_keywords = ['learn', 'learning', 'learning module', 'education', 'course', 'training']
-    
     user_choice = None
     
     # Check for apply job
-    if any(keyword in voice_text for keyword in apply_keywords):
+    if _APPLY_EN_RE.search(voice_text):
         if 'post' not in voice_text:  # Avoid confusion with "post job"
             user_choice = 'apply_job'
     
     # Check for post job
-    if not user_choice and any(keyword in voice_text for keyword in post_keywords):
+    if not user_choice and _POST_EN_RE.search(voice_text):
         user_choice = 'post_job'
     
     # Check for learning module
-    if not user_choice and any(keyword in voice_text for keyword in learning_keywords):
+    if not user_choice and _LEARNING_EN_RE.search(voice_text):
         user_choice = 'learning_module'
     
     if not user_choice:
@@ -311,17 +555,14 @@ def save_user_choice():
         c = conn.cursor()
         
         # Update user choice in database
-        c.execute('UPDATE workers SET user_choice = ? WHERE phone_number = ?', 
-                  (user_choice, phone))
+        c.execute(_SQL_SET_USER_CHOICE, (user_choice, phone))
         
         if c.rowcount == 0:
             # If no row updated, user might not exist - create a basic record
             ts = datetime.utcnow().isoformat()
-            c.execute('''INSERT INTO workers (timestamp, phone_number, user_choice, profile_created) 
-                        VALUES (?, ?, ?, 0)''', (ts, phone, user_choice))
+            c.execute(_SQL_INSERT_USER_CHOICE, (ts, phone, user_choice))
         
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -388,41 +629,22 @@ def recognize_voice_choice():
         text_lower = text.lower()
         
         # Process to determine choice - support both English and Hindi
-        # English keywords
-        apply_keywords_en = ['apply', 'job', 'apply job', 'apply for job', 'find job', 'search job']
-        post_keywords_en = ['post', 'post job', 'create job', 'add job', 'list job']
-        learning_keywords_en = ['learn', 'learning', 'learning module', 'education', 'course', 'training', 'study']
-        
-        # Hindi keywords (both Devanagari and transliterated)
-        apply_keywords_hi = ['अप्लाई', 'जॉब', 'नौकरी', 'काम', 'खोज', 'ढूंढ']
-        post_keywords_hi = ['पोस्ट', 'नौकरी देना', 'भर्ती', 'विज्ञापन']
-        learning_keywords_hi = [
-            'सीखना', 'सीख', 'शिक्षा', 'पढ़ाई', 'पढ़ना', 'ट्रेनिंग', 'प्रशिक्षण',
-            'कोर्स', 'मॉड्यूल', 'लर्निंग', 'एजुकेशन', 'ज्ञान', 'अध्ययन',
-            'seekh', 'padhai', 'training', 'module'
-        ]
-        
-        # Combine all keywords
-        apply_keywords = apply_keywords_en + apply_keywords_hi
-        post_keywords = post_keywords_en + post_keywords_hi
-        learning_keywords = learning_keywords_en + learning_keywords_hi
-        
         user_choice = None
         
         # Check for learning module FIRST (more specific)
-        if any(keyword in text_lower for keyword in ['learning module', 'लर्निंग मॉड्यूल', 'module', 'मॉड्यूल']):
+        if _MODULE_RE.search(text_lower):
             user_choice = 'learning_module'
-        elif any(keyword in text_lower for keyword in learning_keywords):
+        elif _LEARNING_RE.search(text_lower):
             user_choice = 'learning_module'
         
         # Check for post job
-        if not user_choice and any(keyword in text_lower for keyword in post_keywords):
+        if not user_choice and _POST_RE.search(text_lower):
             user_choice = 'post_job'
         
         # Check for apply job (check last to avoid conflicts)
-        if not user_choice and any(keyword in text_lower for keyword in apply_keywords):
+        if not user_choice and _APPLY_RE.search(text_lower):
             # Make sure it's not "post job"
-            if not any(keyword in text_lower for keyword in ['post', 'पोस्ट']):
+            if not _POST_MARKER_RE.search(text_lower):
                 user_choice = 'apply_job'
         
         if not user_choice:
@@ -435,14 +657,11 @@ def recognize_voice_choice():
         # Save choice to database
         conn = get_db_connection()
         c = conn.cursor()
-        c.execute('UPDATE workers SET user_choice = ? WHERE phone_number = ?', 
-                  (user_choice, phone))
+        c.execute(_SQL_SET_USER_CHOICE, (user_choice, phone))
         if c.rowcount == 0:
             ts = datetime.utcnow().isoformat()
-            c.execute('''INSERT INTO workers (timestamp, phone_number, user_choice, profile_created) 
-                        VALUES (?, ?, ?, 0)''', (ts, phone, user_choice))
+            c.execute(_SQL_INSERT_USER_CHOICE, (ts, phone, user_choice))
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -474,21 +693,9 @@ def get_questions():
     """Get onboarding questions (text only)"""
     language = request.args.get('language', 'en')
     
-    questions = [
-        {'key': 'name', 'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
-        {'key': 'skill', 'en': 'What is your skill? (eg: plumber, painter)', 'hi': 'आपका कौशल क्या है? (जैसे: पलंबर, पेंटर)'},
-        {'key': 'education', 'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
-        {'key': 'age', 'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
-        {'key': 'sex', 'en': 'What is your sex? (male/female)', 'hi': 'आपका लिंग क्या है? (पुरुष/महिला)'},
-        {'key': 'experience', 'en': 'How many years of experience?', 'hi': 'अनुभव के वर्षों की संख्या क्या है?'},
-        {'key': 'location', 'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
-        {'key': 'wage_expected', 'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
-        {'key': 'languages_known', 'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
-    ]
-    
     return jsonify({
         'success': True,
-        'questions': questions
+        'questions': _ONBOARDING_QUESTIONS
     }), 200
 
 @app.route('/api/onboarding/question/<question_key>', methods=['GET'])
@@ -496,37 +703,18 @@ def get_question_voice(question_key):
     """Get a specific onboarding question with voice audio"""
     language = request.args.get('language', 'en')
     
-    questions_map = {
-        'name': {'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
-        'skill': {'en': 'What is your skill? For example, plumber, painter, electrician?', 'hi': 'आपका कौशल क्या है? जैसे: पलंबर, पेंटर, इलेक्ट्रीशियन?'},
-        'education': {'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
-        'age': {'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
-        'sex': {'en': 'What is your sex? Male or female?', 'hi': 'आपका लिंग क्या है? पुरुष या महिला?'},
-        'experience': {'en': 'How many years of experience do you have?', 'hi': 'आपको कितने वर्षों का अनुभव है?'},
-        'location': {'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
-        'wage_expected': {'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
-        'languages_known': {'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
-    }
-    
-    if question_key not in questions_map:
+    if question_key not in _QUESTION_VOICE_TEXT:
         return jsonify({
             'success': False,
             'message': 'Invalid question key'
         }), 400
     
-    question_text = questions_map[question_key].get(language, questions_map[question_key]['en'])
+    prompts = _QUESTION_VOICE_TEXT[question_key]
+    question_text = prompts.get(language, prompts['en'])
     
     try:
-        # Generate TTS audio
-        tts = gTTS(text=question_text, lang=language if language == 'hi' else 'en', slow=False)
-        
-        # Save to in-memory buffer
-        audio_buffer = io.BytesIO()
-        tts.write_to_fp(audio_buffer)
-        audio_buffer.seek(0)
-        
-        # Convert to base64 for JSON response
-        audio_base64 = base64.b64encode(audio_buffer.read()).decode('utf-8')
+        # Generate TTS audio as base64 for JSON response
+        audio_base64 = tts_base64(question_text, language if language == 'hi' else 'en')
         
         return jsonify({
             'success': True,
@@ -594,32 +782,8 @@ def save_onboarding_answer():
             
             # Save to database (temporary storage until complete_onboarding)
             conn = get_db_connection()
-            c = conn.cursor()
-            
-            # Get or create user record
-            c.execute('SELECT raw_answers FROM workers WHERE phone_number = ?', (phone,))
-            result = c.fetchone()
-            
-            if result and result['raw_answers']:
-                answers = json.loads(result['raw_answers'])
-            else:
-                answers = {}
-            
-            # Update answer
-            answers[question_key] = answer_text
-            
-            # Save back
-            if result:
-                c.execute('UPDATE workers SET raw_answers = ? WHERE phone_number = ?',
-                         (json.dumps(answers, ensure_ascii=False), phone))
-            else:
-                ts = datetime.utcnow().isoformat()
-                c.execute('''INSERT INTO workers (timestamp, phone_number, raw_answers, profile_created) 
-                            VALUES (?, ?, ?, 0)''',
-                         (ts, phone, json.dumps(answers, ensure_ascii=False)))
-            
+            _merge_raw_answers(conn, phone, {question_key: answer_text})
             conn.commit()
-            conn.close()
             
             return jsonify({
                 'success': True,
@@ -658,32 +822,8 @@ def save_onboarding_answer():
         
         try:
             conn = get_db_connection()
-            c = conn.cursor()
-            
-            # Get or create user record
-            c.execute('SELECT raw_answers FROM workers WHERE phone_number = ?', (phone,))
-            result = c.fetchone()
-            
-            if result and result['raw_answers']:
-                answers = json.loads(result['raw_answers'])
-            else:
-                answers = {}
-            
-            # Update answer
-            answers[question_key] = answer_text
-            
-            # Save back
-            if result:
-                c.execute('UPDATE workers SET raw_answers = ? WHERE phone_number = ?',
-                         (json.dumps(answers, ensure_ascii=False), phone))
-            else:
-                ts = datetime.utcnow().isoformat()
-                c.execute('''INSERT INTO workers (timestamp, phone_number, raw_answers, profile_created) 
-                            VALUES (?, ?, ?, 0)''',
-                         (ts, phone, json.dumps(answers, ensure_ascii=False)))
-            
+            _merge_raw_answers(conn, phone, {question_key: answer_text})
             conn.commit()
-            conn.close()
             
             return jsonify({
                 'success': True,
@@ -698,6 +838,63 @@ def save_onboarding_answer():
                 'message': f'Error saving answer: {str(e)}'
             }), 500
 
+@app.route('/api/onboarding/answers', methods=['POST'])
+@require_auth
+def save_onboarding_answers():
+    """Save several text onboarding answers in one request"""
+    phone = get_phone_from_token()
+    if not phone:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 401
+    
+    data = request.get_json(silent=True)
+    items = data.get('answers') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return jsonify({
+            'success': False,
+            'message': 'answers must be a non-empty list of {question_key, answer_text}'
+        }), 400
+    
+    # Validate every item before saving any of them
+    errors = []
+    new_answers = {}
+    for i, item in enumerate(items):
+        question_key = item.get('question_key') if isinstance(item, dict) else None
+        answer_text = item.get('answer_text') if isinstance(item, dict) else None
+        if not (isinstance(question_key, str) and question_key
+                and isinstance(answer_text, str) and answer_text):
+            errors.append({
+                'index': i,
+                'message': 'question_key and answer_text must be non-empty strings'
+            })
+            continue
+        new_answers[question_key] = answer_text
+    
+    if errors:
+        return jsonify({
+            'success': False,
+            'message': 'Invalid answers; nothing was saved',
+            'errors': errors
+        }), 400
+    
+    try:
+        conn = get_db_connection()
+        # One read-modify-write of raw_answers for the whole batch
+        _merge_raw_answers(conn, phone, new_answers)
+        conn.commit()
+        
+        return jsonify({
+            'success': True,
+            'saved': len(new_answers),
+            'answers': new_answers,
+            'phone_number': phone
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error saving answers: {str(e)}'
+        }), 500
+
 @app.route('/api/onboarding/complete', methods=['POST'])
 @require_auth
 def complete_onboarding():
@@ -720,54 +917,22 @@ def complete_onboarding():
         c.execute('SELECT id, profile_created FROM workers WHERE phone_number = ?', (phone,))
         existing = c.fetchone()
         
-        raw_answers = json.dumps(answers, ensure_ascii=False)
+        raw_answers = _dump_answers(answers)
         ts = datetime.utcnow().isoformat()
+        fields = tuple(answers.get(k, '') for k in _ANSWER_FIELDS)
         
         if existing:
             # Update existing record
-            c.execute('''UPDATE workers SET 
-                timestamp = ?, profile_created = 1, name = ?, skill = ?, education = ?, age = ?, 
-                sex = ?, experience = ?, location = ?, aadhaar = ?, wage_expected = ?, 
-                languages_known = ?, raw_answers = ?
-                WHERE id = ?''',
-                (ts,
-                 answers.get('name', ''),
-                 answers.get('skill', ''),
-                 answers.get('education', ''),
-                 answers.get('age', ''),
-                 answers.get('sex', ''),
-                 answers.get('experience', ''),
-                 answers.get('location', ''),
-                 answers.get('aadhaar', ''),
-                 answers.get('wage_expected', ''),
-                 answers.get('languages_known', ''),
-                 raw_answers,
-                 existing['id']
-                 ))
+            c.execute(_SQL_UPDATE_ONBOARDED,
+                      (ts, *fields, raw_answers, existing['id']))
             worker_id = existing['id']
         else:
             # Insert new record
-            c.execute('''INSERT INTO workers 
-                (timestamp, phone_number, profile_created, name, skill, education, age, sex, 
-                 experience, location, aadhaar, wage_expected, languages_known, raw_answers) 
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)''',
-                (ts, phone, 1,
-                 answers.get('name', ''),
-                 answers.get('skill', ''),
-                 answers.get('education', ''),
-                 answers.get('age', ''),
-                 answers.get('sex', ''),
-                 answers.get('experience', ''),
-                 answers.get('location', ''),
-                 answers.get('aadhaar', ''),
-                 answers.get('wage_expected', ''),
-                 answers.get('languages_known', ''),
-                 raw_answers
-                 ))
+            c.execute(_SQL_INSERT_ONBOARDED,
+                      (ts, phone, 1, *fields, raw_answers))
             worker_id = c.lastrowid
         
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -794,11 +959,8 @@ def get_worker_profile():
     
     conn = get_db_connection()
     c = conn.cursor()
-    c.execute('''SELECT id, phone_number, name, skill, education, age, sex, experience, 
-                 location, aadhaar, wage_expected, languages_known, profile_created, timestamp
-                 FROM workers WHERE phone_number = ?''', (phone,))
+    c.execute(_SQL_SELECT_PROFILE, (phone,))
     row = c.fetchone()
-    conn.close()
     
     if not row:
         return jsonify({'success': False, 'message': 'Profile not found'}), 404
@@ -840,7 +1002,6 @@ def update_worker_profile():
              ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -869,17 +1030,10 @@ def get_all_workers():
     c = conn.cursor()
     
     if search:
-        c.execute('''SELECT id, phone_number, name, skill, education, age, sex, experience, 
-                     location, aadhaar, wage_expected, languages_known, profile_created, timestamp
-                     FROM workers 
-                     WHERE name LIKE ? OR phone_number LIKE ? OR skill LIKE ?
-                     ORDER BY id DESC LIMIT ? OFFSET ?''',
-                     (f'%{search}%', f'%{search}%', f'%{search}%', limit, offset))
+        c.execute(_SQL_SEARCH_WORKERS,
+                  (f'%{search}%', f'%{search}%', f'%{search}%', limit, offset))
     else:
-        c.execute('''SELECT id, phone_number, name, skill, education, age, sex, experience, 
-                     location, aadhaar, wage_expected, languages_known, profile_created, timestamp
-                     FROM workers ORDER BY id DESC LIMIT ? OFFSET ?''',
-                     (limit, offset))
+        c.execute(_SQL_LIST_WORKERS, (limit, offset))
     
     rows = c.fetchall()
     
@@ -891,8 +1045,6 @@ def get_all_workers():
         c.execute('SELECT COUNT(*) FROM workers')
     total = c.fetchone()[0]
     
-    conn.close()
-    
     workers = [dict(row) for row in rows]
     
     return jsonify({
@@ -911,7 +1063,6 @@ def get_worker_by_id(worker_id):
     c = conn.cursor()
     c.execute('''SELECT * FROM workers WHERE id = ?''', (worker_id,))
     row = c.fetchone()
-    conn.close()
     
     if not row:
         return jsonify({'success': False, 'message': 'Worker not found'}), 404
@@ -948,7 +1099,6 @@ def update_worker_admin(worker_id):
              ))
         
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -970,7 +1120,6 @@ def delete_worker(worker_id):
         c = conn.cursor()
         c.execute('DELETE FROM workers WHERE id = ?', (worker_id,))
         conn.commit()
-        conn.close()
         
         return jsonify({
             'success': True,
@@ -986,42 +1135,33 @@ def delete_worker(worker_id):
 @app.route('/api/admin/workers/export', methods=['GET'])
 @require_auth
 def export_workers_csv():
-    """Export workers to CSV (admin)"""
-    import csv
-    import io
-    
-    conn = get_db_connection()
-    c = conn.cursor()
-    c.execute('''SELECT id, timestamp, phone_number, name, skill, education, age, sex, 
-                 experience, location, aadhaar, wage_expected, languages_known, raw_answers 
-                 FROM workers ORDER BY id''')
-    rows = c.fetchall()
-    conn.close()
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow(['id', 'timestamp', 'phone_number', 'name', 'skill', 'education', 'age', 
-                     'sex', 'experience', 'location', 'aadhaar', 'wage_expected', 
-                     'languages_known', 'raw_answers'])
-    
-    # Write data
-    for row in rows:
-        writer.writerow([row['id'], row['timestamp'], row['phone_number'], row['name'], 
-                        row['skill'], row['education'], row['age'], row['sex'], 
-                        row['experience'], row['location'], row['aadhaar'], 
-                        row['wage_expected'], row['languages_known'], row['raw_answers']])
-    
-    output.seek(0)
-    
-    return send_file(
-        io.BytesIO(output.getvalue().encode('utf-8')),
+    """Export workers to CSV (admin), streamed as rows are read"""
+    return Response(
+        _iter_workers_csv(),
         mimetype='text/csv',
-        as_attachment=True,
-        download_name='workers_export.csv'
+        headers={'Content-Disposition': 'attachment; filename=workers_export.csv'}
     )
 
+def _iter_workers_csv(batch=500):
+    """Yield the workers CSV a batch of rows at a time.
+    The body is produced after the request context is gone, so this holds
+    its own pooled connection instead of g.db.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    with pooled_connection() as conn:
+        writer.writerow(_EXPORT_COLUMNS)
+        yield buf.getvalue()
+        cur = conn.execute(_SQL_EXPORT_WORKERS)
+        while True:
+            rows = cur.fetchmany(batch)
+            if not rows:
+                break
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows(rows)
+            yield buf.getvalue()
+
 # ==================== HEALTH CHECK ====================
 
 @app.route('/api/health', methods=['GET'])
@@ -0,0 +1,7 @@
+"""Shared HTTP session for the API test scripts"""
+import requests
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session for every call so a script run reuses its connections
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
@@ -1,8 +1,16 @@
 import sys
+import io
 import json
 import sqlite3
 import os
+import hashlib
+import logging
+import threading
+import tempfile
 from datetime import datetime
+from collections import namedtuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 
 # Compatibility shims for modules removed in Python 3.13
 # These are needed by speech_recognition library
@@ -69,16 +77,22 @@ from PyQt5.QtWidgets import (
     QPlainTextEdit,
     QLabel,
     QFileDialog,
-    QTableWidget,
-    QTableWidgetItem,
-    QHBoxLayout,
+    QTableView,
+    QAbstractItemView,
+    QMenu,
+    QCheckBox,
     QDialog,
     QLineEdit,
     QMessageBox,
 )
 from PyQt5.QtCore import (
     QThread,
+    QMutex,
+    QWaitCondition,
     pyqtSignal,
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
     QUrl,
     QPropertyAnimation,
     QEasingCurve
@@ -89,57 +103,530 @@ import speech_recognition as sr
 from translate import Translator
 from gtts import gTTS
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
 import re
 import difflib
 
+log = logging.getLogger(__name__)
+
+# RapidFuzz (C++ edit distance) for fuzzy matching; difflib is the pure-Python fallback
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+except ImportError:
+    fuzz_process = None
+
+
+def _closest_match(word, choices, cutoff):
+    """Return the entry of choices most similar to word with similarity >= cutoff (0-1), or None."""
+    if fuzz_process is not None:
+        # fuzz.ratio is the same normalized similarity difflib scores, on a 0-100 scale
+        hit = fuzz_process.extractOne(word, choices, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return hit[0] if hit else None
+    match = difflib.get_close_matches(word, choices, n=1, cutoff=cutoff)
+    return match[0] if match else None
+
+
+@lru_cache(maxsize=16)
+def _get_translator(src, tgt):
+    """Shared Translator per language pair (instances keep no per-call state)."""
+    return Translator(from_lang=src, to_lang=tgt)
+
+
+# Keep-alive session so repeated fallback translations reuse the TCP/TLS connection;
+# transient connection failures are retried with a short backoff
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2)))
+
+
+# Speech recognition backend: 'google' (web API, default) or 'whisper' (on-device
+# faster-whisper, int8 on CPU). Select with the ASR_BACKEND environment variable.
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+ASR_BACKEND = os.environ.get('ASR_BACKEND', 'google').lower()
+WHISPER_MODEL_SIZE = os.environ.get('WHISPER_MODEL', 'base')
+
+# Microphone capture: 16 kHz (what both recognizers consume) in 20 ms chunks,
+# so end-of-phrase is noticed with finer granularity than PyAudio's 1024 frames
+MIC_SAMPLE_RATE = 16000
+MIC_CHUNK_SIZE = 320
+
+# Per-request timeout (seconds) for gTTS, so a stalled synthesis cannot hang
+# a worker thread (and with it, shutdown) indefinitely
+TTS_TIMEOUT = 15
+
+# How long shutdown waits for each worker before giving up on it (milliseconds),
+# so closing the window cannot hang the GUI thread
+SHUTDOWN_WAIT_MS = 2000
+
+
+# A language direction: translation source/target codes and the recognizer locale
+LangCfg = namedtuple('LangCfg', 'src_code tgt_code src_recog')
+
+
+# Bump when init_db() gains a migration; stored in PRAGMA user_version.
+# 2 = workers with phone_number, profile_created, user_choice + idx_workers_phone
+# (a superset of the API server's schema version 1, which shares this DB file)
+SCHEMA_VERSION = 2
+
+
+# Text normalization tables and patterns, built once at import
+_DEVA_DIGIT_TRANS = str.maketrans('०१२३४५६७८९', '0123456789')
+# A digit run with optional whitespace between digits, e.g. '9 8 7' or '९ ८'
+_DIGIT_RUN_RE = re.compile(r'\d(?:\s+\d)*')
+_LANG_SPLIT_RE = re.compile(r'[,\|/]+|\s{2,}')
+_HINDI_RE = re.compile(r'[\u0900-\u097F]')
+_SINGLE_TOKEN_RE = re.compile(r'\b\w\b')
+_NONLETTER_RE = re.compile(r'[^a-zA-Z\u0900-\u097F\s\-]')
+_NON_DIGIT_RE = re.compile(r'\D+')
+_PHONE_RE = re.compile(r'\d{10}')
+_OTP_RE = re.compile(r'\d{6}')
+_SAFE_TAG_RE = re.compile(r'[^a-zA-Z0-9_]+')
+_WS_RE = re.compile(r'\s+')
+
+def _join_digit_run(m):
+    return ''.join(m.group().split()).translate(_DEVA_DIGIT_TRANS)
+
+_CANONICAL_LANGS = (
+    'Hindi','English','Kannada','Telugu','Marathi','Bengali','Tamil','Gujarati',
+    'Urdu','Punjabi','Malayalam','Odia','Assamese','Konkani'
+)
+# common confusions map
+_LANG_MANUAL = {
+    'canada': 'Kannada',
+    'kanada': 'Kannada',
+    'kannad': 'Kannada',
+    'hinglish': 'English',
+    'eng': 'English',
+    'hin': 'Hindi',
+}
+# exact (case-insensitive) language names, checked before any similarity scoring
+_LANG_BY_LOWER = {l.lower(): l for l in _CANONICAL_LANGS}
+_LANG_BY_LOWER.update(_LANG_MANUAL)
+
+
+# number words for _parse_number_words: basic mappings up to 100 and common tens
+_EN_NUM = {sys.intern(k): v for k, v in {
+    'zero':0,'one':1,'two':2,'three':3,'four':4,'five':5,'six':6,'seven':7,'eight':8,'nine':9,
+    'ten':10,'eleven':11,'twelve':12,'thirteen':13,'fourteen':14,'fifteen':15,'sixteen':16,'seventeen':17,'eighteen':18,'nineteen':19,
+    'twenty':20,'thirty':30,'forty':40,'fifty':50,'sixty':60,'seventy':70,'eighty':80,'ninety':90,'hundred':100
+}.items()}
+_HI_NUM = {sys.intern(k): v for k, v in {
+    'शून्य':0,'एक':1,'दो':2,'तीन':3,'चार':4,'पांच':5,'पाँच':5,'छह':6,'सात':7,'आठ':8,'नौ':9,
+    'दस':10,'ग्यारह':11,'बारह':12,'तेरह':13,'चौदह':14,'पंद्रह':15,'सोलह':16,'सत्रह':17,'अठारह':18,'उन्नीस':19,
+    'बीस':20,'तीस':30,'चालीस':40,'पचास':50,'साठ':60,'सत्तर':70,'अस्सी':80,'नब्बे':90,'सौ':100
+}.items()}
+# single lookup table for both languages (the key sets are disjoint)
+_NUM_WORDS = {**_EN_NUM, **_HI_NUM}
+# workers fields with few distinct values (interned when stored/displayed) and
+# their admin dashboard display columns
+_LOW_CARD_FIELDS = ('skill', 'sex', 'education', 'location', 'languages_known')
+_LOW_CARD_DISPLAY_COLS = frozenset((2, 3, 5, 7, 10))
+_SKILL_REPLACEMENTS = {
+    'vaidya': 'Doctor',
+    'vaidhya': 'Doctor',
+    'vaid': 'Doctor',
+    'vedya': 'Doctor',
+    'doctor': 'Doctor',
+    'physician': 'Doctor',
+    'plumber': 'Plumber',
+    'painter': 'Painter',
+    'carpenter': 'Carpenter',
+    'electrician': 'Electrician',
+    'software engineer': 'Software Engineer',
+    'driver': 'Driver',
+    'cook': 'Cook',
+    'chef': 'Cook',
+    'mason': 'Mason',
+}
+_SKILL_KEYS = tuple(_SKILL_REPLACEMENTS)
+_GENDER_MAP = {
+    'male': 'Male',
+    'man': 'Male',
+    'men': 'Male',
+    'female': 'Female',
+    'woman': 'Female',
+    'women': 'Female',
+    'पुरुष': 'Male',
+    'महिला': 'Female',
+}
+_GENDER_KEYS = tuple(_GENDER_MAP)
+
+
+def _fallback_google_translate(text, src, tgt):
+    """Use the unofficial Google Translate web API as a fallback.
+    Returns translated text or raises on failure.
+    """
+    # build request to translate.googleapis.com
+    base = 'https://translate.googleapis.com/translate_a/single'
+    params = {
+        'client': 'gtx',
+        'sl': src,
+        'tl': tgt,
+        'dt': 't',
+        'q': text,
+    }
+    url = base + '?' + urllib.parse.urlencode(params)
+    resp = _HTTP_SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    data = resp.json()
+    # data[0] contains list of translation segments
+    parts = [seg[0] for seg in data[0] if seg and seg[0]]
+    return ''.join(parts)
+
+
+def _is_suspicious_translation(src_text, translated_text):
+    """Detect obviously-broken translations: identical to source or many tiny-line fragments.
+    Returns True if translation looks bad.
+    """
+    if not translated_text:
+        return True
+    stripped = translated_text.strip()
+    src_stripped = src_text.strip()
+    # identical/trivial, or too short compared to source
+    if stripped == src_stripped or len(stripped) < max(3, len(src_stripped) // 3):
+        return True
+    # single pass over the lines: count short lines and single-letter tokens
+    # (e.g., "s \n S \n Sinivas" produces single letters)
+    total_lines = short_lines = single_letters = 0
+    for line in translated_text.splitlines():
+        total_lines += 1
+        if len(line.strip()) <= 2:
+            short_lines += 1
+        for _ in _SINGLE_TOKEN_RE.finditer(line):
+            single_letters += 1
+            if single_letters >= 2:
+                return True
+    return total_lines >= 2 and short_lines >= total_lines // 2
+
+
+@lru_cache(maxsize=4096)
+def _do_translate(text, src, tgt):
+    """Translate text src->tgt, falling back to the Google web API when the
+    primary Translator result looks broken. Memoized for the process lifetime;
+    raises (and so caches nothing) when neither backend produced any text.
+    """
+    try:
+        t = _get_translator(src, tgt).translate(text)
+    except Exception:
+        t = ''
+    if t and not _is_suspicious_translation(text, t):
+        return t
+    try:
+        t_fb = _fallback_google_translate(text, src, tgt)
+    except Exception:
+        if not t:
+            raise
+        return t
+    return t_fb or t or text
+
+
+def _contains_hindi(text):
+    try:
+        s = str(text or '')
+        # most stored values are plain English; isascii() reads a flag CPython
+        # keeps on the string, so those skip the scan entirely
+        if s.isascii():
+            return False
+        return _HINDI_RE.search(s) is not None
+    except Exception:
+        return False
+
+
+def _translate_to_english(text, assumed_src=None):
+    """Translate arbitrary text to English with fallback and heuristics."""
+    try:
+        src = assumed_src
+        if src is None:
+            src = 'hi' if _contains_hindi(text) else 'en'
+        if src == 'en':
+            return text
+        if not text:
+            return ''
+        return _do_translate(str(text), src, 'en')
+    except Exception:
+        return str(text or '')
+
+
+def _translate_batch_to_english(values):
+    """Translate several values to English with one request where possible.
+
+    Hindi values are joined with newlines, translated together and split back
+    into place; if the translation does not keep one non-empty line per value,
+    each is translated on its own instead. Other values are returned unchanged.
+    """
+    out = list(values)
+    idx = [i for i, v in enumerate(values) if v and _contains_hindi(v)]
+    if len(idx) > 1:
+        payload = '\n'.join(_WS_RE.sub(' ', str(values[i])).strip() for i in idx)
+        try:
+            lines = _do_translate(payload, 'hi', 'en').split('\n')
+        except Exception:
+            lines = []
+        if len(lines) == len(idx) and all(line.strip() for line in lines):
+            for i, line in zip(idx, lines):
+                out[i] = line.strip()
+            return out
+    for i in idx:
+        out[i] = _translate_to_english(values[i], assumed_src='hi')
+    return out
+
+
+# The normalizers below are pure functions of a string and see the same few
+# values over and over (onboarding answers, admin dashboard cells), so they
+# are memoized. Translation is cached separately by _do_translate and kept
+# out of these, so a failed network call is never memoized.
+
+@lru_cache(maxsize=4096)
+def _normalize_digits(text):
+    """Convert Devanagari digits to ASCII and trim spaces inside digit groups."""
+    # Single pass: collapse spaces inside each digit run ('1 2 3' -> '123')
+    # and map its Devanagari digits to ASCII
+    return _DIGIT_RUN_RE.sub(_join_digit_run, text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_languages(text):
+    """Normalize language list to canonical English names using fuzzy match."""
+    tokens = _LANG_SPLIT_RE.split(text)
+    out = []
+    for tok in tokens:
+        t = tok.strip()
+        if not t:
+            continue
+        lower = t.lower()
+        if lower in _LANG_BY_LOWER:
+            out.append(_LANG_BY_LOWER[lower])
+            continue
+        # fuzzy to canonical
+        match = _closest_match(t, _CANONICAL_LANGS, 0.75)
+        if not match:
+            match = _closest_match(t.title(), _CANONICAL_LANGS, 0.72)
+        out.append(match or t)
+    # de-duplicate while preserving order
+    return ' '.join(dict.fromkeys(out))
+
+
+@lru_cache(maxsize=4096)
+def _canonical_skill(s):
+    """Map an English skill string to a canonical role; otherwise capitalize its words."""
+    lower = s.lower()
+    # choose best fuzzy match among keys
+    match = _closest_match(lower, _SKILL_KEYS, 0.8)
+    if match:
+        return _SKILL_REPLACEMENTS[match]
+    # try looser cutoff
+    match = _closest_match(lower, _SKILL_KEYS, 0.7)
+    if match:
+        return _SKILL_REPLACEMENTS[match]
+    # Capitalize words
+    return ' '.join(w.capitalize() for w in s.split())
+
+
+@lru_cache(maxsize=4096)
+def _normalize_gender(text):
+    s = text.strip().lower()
+    if s in _GENDER_MAP:
+        return _GENDER_MAP[s]
+    # fuzzy
+    match = _closest_match(s, _GENDER_KEYS, 0.8)
+    return _GENDER_MAP.get(match, s.capitalize() if s else '')
+
+
+@lru_cache(maxsize=4096)
+def _parse_number_words(text):
+    """Parse simple English/Hindi number words to digits. Returns string digits or ''."""
+    s = text.strip().lower()
+    # Remove non-letter separators
+    s = _NONLETTER_RE.sub(' ', s)
+    tokens = s.split()
+    total = 0
+    current = 0
+    matched = False
+    for t in tokens:
+        val = _NUM_WORDS.get(t)
+        if val is None:
+            continue
+        matched = True
+        if val == 100:
+            current = max(1, current) * val
+        elif val >= 20 and val % 10 == 0:
+            current += val
+        else:
+            current += val
+    total += current
+    return str(total) if matched and total > 0 else ''
+
+
+def _tts_cache_path(audio_dir, text, lang, prefix='prompt'):
+    """Cache path for synthesized speech, keyed on the SHA1 of (lang, text)."""
+    digest = hashlib.sha1(f"{lang}\0{text}".encode('utf-8')).hexdigest()
+    return os.path.join(audio_dir, f"{prefix}_{digest}.mp3")
+
+
+def _cached_tts(audio_dir, text, lang, prefix='prompt'):
+    """Return the cached MP3 for (text, lang), synthesizing it with gTTS on a miss."""
+    path = _tts_cache_path(audio_dir, text, lang, prefix)
+    if os.path.exists(path):
+        return path
+    fd, tmp = tempfile.mkstemp(suffix='.mp3', dir=audio_dir)
+    os.close(fd)
+    try:
+        gTTS(text, lang=lang, timeout=TTS_TIMEOUT).save(tmp)
+        # atomic rename: the player never sees a half-written file
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return path
+
 
 class SpeechRecognitionThread(QThread):
+    """Long-lived worker that captures and recognizes one utterance per request_listen().
+    Ambient-noise calibration (request_calibration()) runs on the same thread, so
+    only this thread ever reads the session microphone.
+    """
     recognition_result = pyqtSignal(str)
     status_signal = pyqtSignal(str)
+    # emitted after each utterance, whatever its outcome
+    utterance_done = pyqtSignal()
 
-    def __init__(self, recognizer, language=None):
+    def __init__(self, recognizer, language=None, asr_model=None, source=None):
         super().__init__()
         self.recognizer = recognizer
+        # session microphone source held open by the app; None opens one per recording
+        self.source = source
         # language passed to recognizer.recognize_google, e.g. 'en-US' or 'hi-IN'
         self.language = language
+        # loaded faster-whisper model; None means recognize with Google
+        self.asr_model = asr_model
+        # 4000 until request_calibration() has measured the room; the recognizer
+        # is reused, so dynamic adjustment carries over from one utterance to the next
+        try:
+            self.recognizer.energy_threshold = 4000
+            self.recognizer.dynamic_energy_threshold = True
+            # end the phrase after 0.5 s of silence (default 0.8 s)
+            self.recognizer.pause_threshold = 0.5
+            self.recognizer.non_speaking_duration = 0.3
+            self.recognizer.operation_timeout = 30
+        except Exception:
+            pass
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+        self._pending = False
+        self._calibrate = False
+        self._running = True
+
+    def request_calibration(self):
+        """Queue an ambient-noise calibration; it runs before any queued utterance."""
+        self._mutex.lock()
+        try:
+            self._calibrate = True
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
 
-    def run(self):
+    def request_listen(self, language=None):
+        """Queue one utterance in the given recognition language."""
+        self._mutex.lock()
         try:
-            with sr.Microphone() as source:
-                self.status_signal.emit("Adjusting for ambient noise...")
-                # Adjust for ambient noise and set timeout
-                try:
+            self.language = language
+            self._pending = True
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def stop(self):
+        """Exit the worker loop once the current utterance (if any) is done."""
+        self._mutex.lock()
+        try:
+            self._running = False
+            self._wake.wakeOne()
+        finally:
+            self._mutex.unlock()
+
+    def transcribe_local(self, audio):
+        """Transcribe captured audio with the on-device Whisper model."""
+        wav = io.BytesIO(audio.get_wav_data(convert_rate=16000))
+        lang = self.language.split('-')[0] if self.language else None
+        segments, _ = self.asr_model.transcribe(wav, language=lang)
+        return ' '.join(seg.text.strip() for seg in segments).strip()
+
+    def capture(self, source):
+        """Listen for one phrase on source; returns None (after reporting) on timeout."""
+        self.status_signal.emit("Microphone ready - speak now")
+
+        # Listen with reasonable timeout and phrase limit
+        try:
+            audio = self.recognizer.listen(
+                source,
+                timeout=10,  # max seconds to wait for phrase to start
+                phrase_time_limit=30,  # max seconds for phrase
+            )
+            self.status_signal.emit("Audio recorded")
+            return audio
+        except sr.WaitTimeoutError:
+            # No speech detected in timeout window - emit empty result to keep flow
+            self.status_signal.emit("No speech detected (timeout)")
+            self.recognition_result.emit("")
+            return None
+
+    def calibrate(self):
+        """Set the recognizer's energy threshold from 1 s of ambient noise."""
+        try:
+            if self.source is not None:
+                self.recognizer.adjust_for_ambient_noise(self.source, duration=1)
+            else:
+                with sr.Microphone(sample_rate=MIC_SAMPLE_RATE, chunk_size=MIC_CHUNK_SIZE) as source:
                     self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                except Exception:
-                    # If adjust fails, continue with defaults
-                    pass
-                # tweak thresholds for better capture
-                try:
-                    self.recognizer.energy_threshold = 4000
-                    self.recognizer.dynamic_energy_threshold = True
-                except Exception:
-                    pass
-                self.status_signal.emit("Microphone ready - speak now")
+        except Exception:
+            # No microphone or calibration failed: recordings use the default threshold
+            pass
 
-                # Listen with reasonable timeout and phrase limit
-                try:
-                    audio = self.recognizer.listen(
-                        source,
-                        timeout=10,  # max seconds to wait for phrase to start
-                        phrase_time_limit=30,  # max seconds for phrase
-                    )
-                    self.status_signal.emit("Audio recorded")
-                except sr.WaitTimeoutError:
-                    # No speech detected in timeout window - emit empty result to keep flow
-                    self.status_signal.emit("No speech detected (timeout)")
-                    self.recognition_result.emit("")
+    def run(self):
+        while True:
+            self._mutex.lock()
+            try:
+                while self._running and not (self._pending or self._calibrate):
+                    self._wake.wait(self._mutex)
+                if not self._running:
                     return
+                calibrate, listen = self._calibrate, self._pending
+                self._calibrate = self._pending = False
+            finally:
+                self._mutex.unlock()
+            if calibrate:
+                self.calibrate()
+            if listen:
+                self.listen_once()
+                self.utterance_done.emit()
+
+    def listen_once(self):
+        try:
+            if self.source is not None:
+                audio = self.capture(self.source)
+            else:
+                with sr.Microphone(sample_rate=MIC_SAMPLE_RATE, chunk_size=MIC_CHUNK_SIZE) as source:
+                    audio = self.capture(source)
+            if audio is None:
+                return
 
             try:
                 self.status_signal.emit("Recognizing...")
+                if self.asr_model is not None:
+                    text = self.transcribe_local(audio)
+                    if not text:
+                        raise sr.UnknownValueError()
                 # pass language if provided
-                if self.language:
+                elif self.language:
                     text = self.recognizer.recognize_google(audio, language=self.language)
                 else:
                     text = self.recognizer.recognize_google(audio)
@@ -163,6 +650,62 @@ class SpeechRecognitionThread(QThread):
                 pass
 
 
+class PromptAudioThread(QThread):
+    """Pre-generate cached TTS audio for the onboarding prompts at startup."""
+
+    def __init__(self, audio_dir, prompts):
+        super().__init__()
+        self.audio_dir = audio_dir
+        # iterable of (text, lang) pairs
+        self.prompts = prompts
+
+    def run(self):
+        for text, lang in self.prompts:
+            if self.isInterruptionRequested():
+                return
+            try:
+                _cached_tts(self.audio_dir, text, lang)
+            except Exception:
+                # offline or gTTS failure: the prompt is synthesized when first asked
+                pass
+
+
+class WorkerTableModel(QAbstractTableModel):
+    """Admin dashboard rows (already normalized strings), served to the view on demand."""
+    HEADERS = ('Phone','Name','Skill Type','Education','Age','Gender','Experience','Location','Aadhaar','Wage','Languages')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._rows = []
+
+    def set_rows(self, ids, rows):
+        """Replace all rows; ids[i] is the workers.id behind rows[i]."""
+        self.beginResetModel()
+        self._ids = ids
+        self._rows = rows
+        self.endResetModel()
+
+    def worker_id(self, row):
+        return self._ids[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class LoginDialog(QDialog):
     """Login dialog with phone number and OTP verification"""
     login_success = pyqtSignal(str)  # Emits phone number on successful login
@@ -171,10 +714,17 @@ class LoginDialog(QDialog):
     def __init__(self, db_path, parent=None):
         super().__init__(parent)
         self.db_path = db_path
+        # One connection for the dialog's lifetime; closed in done()
+        self._conn = sqlite3.connect(self.db_path)
         self.otp = None
         self.phone_number = None
         self.init_ui()
     
+    def done(self, result):
+        """Close the DB connection however the dialog is dismissed"""
+        self._conn.close()
+        super().done(result)
+    
     def init_ui(self):
         self.setWindowTitle('Login - Phone Number & OTP')
         self.setGeometry(200, 200, 400, 300)
@@ -188,7 +738,12 @@ class LoginDialog(QDialog):
         self.phone_input.setPlaceholderText('Enter 10-digit phone number')
         self.phone_input.setFont(QFont('Arial', 12))
         self.phone_input.setMaxLength(10)
-        # Only allow digits
+        # Only allow digits; validation is debounced so a paste or fast typing
+        # is filtered once rather than on every character
+        self._phone_validate_timer = QTimer(self)
+        self._phone_validate_timer.setSingleShot(True)
+        self._phone_validate_timer.setInterval(50)
+        self._phone_validate_timer.timeout.connect(self._do_validate_phone)
         self.phone_input.textChanged.connect(self.validate_phone)
         
         # OTP input (initially hidden)
@@ -200,6 +755,10 @@ class LoginDialog(QDialog):
         self.otp_input.setFont(QFont('Arial', 12))
         self.otp_input.setMaxLength(6)
         self.otp_input.setVisible(False)
+        self._otp_validate_timer = QTimer(self)
+        self._otp_validate_timer.setSingleShot(True)
+        self._otp_validate_timer.setInterval(50)
+        self._otp_validate_timer.timeout.connect(self._do_validate_otp)
         self.otp_input.textChanged.connect(self.validate_otp)
         self.otp_label = otp_label
         
@@ -240,20 +799,28 @@ class LoginDialog(QDialog):
         self.setLayout(layout)
     
     def validate_phone(self):
+        """Schedule phone validation; restarts on each keystroke"""
+        self._phone_validate_timer.start()
+
+    def _do_validate_phone(self):
         """Validate phone number input (only digits, 10 digits)"""
         text = self.phone_input.text()
         # Remove non-digits
-        digits_only = ''.join(filter(str.isdigit, text))
+        digits_only = _NON_DIGIT_RE.sub('', text)
         if digits_only != text:
             self.phone_input.setText(digits_only)
         # Enable/disable send OTP button
         self.send_otp_button.setEnabled(len(digits_only) == 10)
     
     def validate_otp(self):
+        """Schedule OTP validation; restarts on each keystroke"""
+        self._otp_validate_timer.start()
+
+    def _do_validate_otp(self):
         """Validate OTP input (only digits, 6 digits)"""
         text = self.otp_input.text()
         # Remove non-digits
-        digits_only = ''.join(filter(str.isdigit, text))
+        digits_only = _NON_DIGIT_RE.sub('', text)
         if digits_only != text:
             self.otp_input.setText(digits_only)
         # Enable/disable verify button
@@ -267,7 +834,7 @@ class LoginDialog(QDialog):
     def send_otp(self):
         """Send OTP to phone number"""
         phone = self.phone_input.text().strip()
-        if len(phone) != 10 or not phone.isdigit():
+        if not _PHONE_RE.fullmatch(phone):
             self.status_label.setText('Please enter a valid 10-digit phone number')
             return
         
@@ -296,7 +863,7 @@ class LoginDialog(QDialog):
         entered_otp = self.otp_input.text().strip()
         
         # Accept any 6-digit number (no validation)
-        if len(entered_otp) != 6 or not entered_otp.isdigit():
+        if not _OTP_RE.fullmatch(entered_otp):
             self.status_label.setText('Please enter a 6-digit OTP')
             self.status_label.setStyleSheet("color: red;")
             return
@@ -304,7 +871,7 @@ class LoginDialog(QDialog):
         # OTP accepted (any 6-digit number), check if profile exists
         profile_exists = self.check_profile_exists(self.phone_number)
         
-        print(f"DEBUG: Phone: {self.phone_number}, Profile exists: {profile_exists}")  # Debug output
+        log.debug("Phone: %s, Profile exists: %s", self.phone_number, profile_exists)
         
         if profile_exists:
             # Profile exists - onboarding completed
@@ -323,28 +890,55 @@ class LoginDialog(QDialog):
     def check_profile_exists(self, phone):
         """Check if profile is created for this phone number"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
             # Check if phone exists AND profile_created = 1
-            c.execute('SELECT profile_created FROM workers WHERE phone_number = ?', (phone,))
-            result = c.fetchone()
-            conn.close()
+            result = self._conn.execute(
+                'SELECT profile_created FROM workers WHERE phone_number = ?', (phone,)
+            ).fetchone()
             # Return True if profile_created = 1, False otherwise
             if result is not None:
                 profile_created = result[0]
-                print(f"DEBUG: Found phone {phone}, profile_created = {profile_created}")
+                log.debug("Found phone %s, profile_created = %s", phone, profile_created)
                 return profile_created == 1
             else:
-                print(f"DEBUG: Phone {phone} not found in database")
+                log.debug("Phone %s not found in database", phone)
                 return False
-        except Exception as e:
-            print(f"Error checking profile: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Error checking profile")
             return False
 
 
 class VoiceConverterApp(QWidget):
+    # (audio path or '', error message or '') from jobs on the I/O pool
+    translation_audio_ready = pyqtSignal(str, str)
+    prompt_audio_ready = pyqtSignal(str, str)
+
+    # questions with English and Hindi prompt texts (Aadhaar removed)
+    _ONBOARD_QUESTIONS = (
+        {'key': 'name', 'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
+        {'key': 'skill', 'en': 'What is your skill? (eg: plumber, painter)', 'hi': 'आपका कौशल क्या है? (जैसे: पलंबर, पेंटर)'},
+        {'key': 'education', 'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
+        {'key': 'age', 'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
+        {'key': 'sex', 'en': 'What is your sex? (male/female)', 'hi': 'आपका लिंग क्या है? (पुरुष/महिला)'},
+        {'key': 'experience', 'en': 'How many years of experience?', 'hi': 'अनुभव के वर्षों की संख्या क्या है?'},
+        {'key': 'location', 'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
+        {'key': 'wage_expected', 'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
+        {'key': 'languages_known', 'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
+    )
+
+    # workers columns written by onboarding, in parameter order
+    _PROFILE_COLS = ('name', 'skill', 'education', 'age', 'sex', 'experience', 'location',
+                     'aadhaar', 'wage_expected', 'languages_known', 'raw_answers', 'audio_path')
+    _INSERT_WORKER_SQL = ('INSERT INTO workers (timestamp, phone_number, profile_created, '
+                          + ', '.join(_PROFILE_COLS) + ') VALUES ('
+                          + ','.join('?' * (len(_PROFILE_COLS) + 3)) + ')')
+    _UPDATE_WORKER_SQL = ('UPDATE workers SET timestamp = ?, profile_created = 1, '
+                          + ', '.join(f'{c} = ?' for c in _PROFILE_COLS) + ' WHERE id = ?')
+    # columns editable from the admin dashboard
+    _EDIT_COLS = ('phone_number', 'name', 'skill', 'education', 'age', 'sex', 'experience',
+                  'location', 'aadhaar', 'wage_expected', 'languages_known')
+    _SELECT_EDIT_SQL = 'SELECT ' + ','.join(_EDIT_COLS) + ' FROM workers WHERE id=?'
+    _UPDATE_EDIT_SQL = 'UPDATE workers SET ' + ','.join(f'{c}=?' for c in _EDIT_COLS) + ' WHERE id=?'
+
     def __init__(self):
         super().__init__()
         self.current_phone = None  # Store current logged-in phone number
@@ -398,8 +992,8 @@ class VoiceConverterApp(QWidget):
         # Restrict to two translation directions: English<->Hindi
         # Each entry maps to source recognition locale and language codes
         self.preset_langs = {
-            'English to Hindi': {'src_code': 'en', 'src_recog': 'en-US', 'tgt_code': 'hi'},
-            'Hindi to English': {'src_code': 'hi', 'src_recog': 'hi-IN', 'tgt_code': 'en'},
+            'English to Hindi': LangCfg(src_code='en', src_recog='en-US', tgt_code='hi'),
+            'Hindi to English': LangCfg(src_code='hi', src_recog='hi-IN', tgt_code='en'),
         }
         self.language_dropdown.addItems(list(self.preset_langs.keys()))
 
@@ -453,16 +1047,22 @@ class VoiceConverterApp(QWidget):
         self.selected_src = None
         self.selected_tgt = None
         self.selected_recog = None
-        # translator will be set per-request
-        self.translator = Translator(to_lang="")
 
-        # create a recognition thread placeholder; real one created when recording starts
-        self.recognition_thread = SpeechRecognitionThread(sr.Recognizer())
-        self.recognition_thread.recognition_result.connect(
-            self.translate_and_play
-        )
+        # on-device ASR model, loaded once (None unless ASR_BACKEND=whisper)
+        self._asr = self._load_local_asr()
+        # hold one microphone stream open for the session instead of opening
+        # the audio device for every recording
+        self._mic, self._mic_source = self._open_microphone()
+        # one recognition worker for the session; each utterance is a
+        # request_listen() and its result goes to the handler given in _listen()
+        self._recognition_handler = self.translate_and_play
+        self.recognition_thread = SpeechRecognitionThread(sr.Recognizer(), asr_model=self._asr, source=self._mic_source)
+        self.recognition_thread.recognition_result.connect(self._on_recognition_result)
         self.recognition_thread.status_signal.connect(self.update_status)
-        self.recognition_thread.finished.connect(self.on_recognition_finished)
+        self.recognition_thread.utterance_done.connect(self.on_recognition_finished)
+        self.recognition_thread.start()
+        # calibrate for ambient noise once per session rather than per recording
+        self.recognition_thread.request_calibration()
 
         self.player = QMediaPlayer()
 
@@ -471,12 +1071,28 @@ class VoiceConverterApp(QWidget):
         # initialize DB
         self.db_path = os.path.join(os.path.dirname(__file__), 'transcripts.db')
         self.init_db()
+        # one connection for the app's lifetime; the lock serializes use from worker threads
+        self._conn = self._open_db()
+        self._db_lock = threading.Lock()
+        # blocking gTTS requests and DB writes run here, off the GUI thread; results
+        # come back through the *_audio_ready signals
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # jobs submitted through _submit_io and not yet finished; shutdown waits on them
+        self._io_futures = set()
+        self.translation_audio_ready.connect(self._play_translation)
+        self.prompt_audio_ready.connect(self._play_prompt_and_listen)
         # prepare audio directory for all generated audio files
         self.audio_dir = os.path.join(os.path.dirname(__file__), 'audio')
         try:
             os.makedirs(self.audio_dir, exist_ok=True)
         except Exception:
             pass
+        # synthesize onboarding prompts in the background so asking a question
+        # plays a local file instead of waiting on a gTTS round-trip
+        prompts = [(self._onboard_prompt(q, cfg.src_code), cfg.src_code)
+                   for cfg in self.preset_langs.values() for q in self._ONBOARD_QUESTIONS]
+        self._prompt_audio_thread = PromptAudioThread(self.audio_dir, prompts)
+        self._prompt_audio_thread.start()
 
         # onboarding state
         self.onboarding = False
@@ -495,6 +1111,36 @@ class VoiceConverterApp(QWidget):
         except Exception:
             pass
 
+    def _load_local_asr(self):
+        """Load the faster-whisper model when ASR_BACKEND=whisper; None selects Google."""
+        if ASR_BACKEND != 'whisper':
+            return None
+        if WhisperModel is None:
+            log.warning("ASR_BACKEND=whisper but faster-whisper is not installed; using Google")
+            return None
+        try:
+            return WhisperModel(WHISPER_MODEL_SIZE, device='cpu', compute_type='int8')
+        except Exception as e:
+            log.warning("Could not load Whisper model (%s); using Google", e)
+            return None
+
+    def _open_microphone(self):
+        """Open the session microphone; (None, None) leaves recordings to open their own."""
+        try:
+            mic = sr.Microphone(sample_rate=MIC_SAMPLE_RATE, chunk_size=MIC_CHUNK_SIZE)
+            return mic, mic.__enter__()
+        except Exception as e:
+            log.warning("Could not open microphone (%s); opening it per recording", e)
+            return None, None
+
+    def _listen(self, handler):
+        """Capture one utterance in the selected language and pass its text to handler."""
+        self._recognition_handler = handler
+        self.recognition_thread.request_listen(self.selected_recog)
+
+    def _on_recognition_result(self, text):
+        self._recognition_handler(text)
+
     def fade_in_animation(self):
         self.opacity_effect = QGraphicsOpacityEffect(self)
         self.setGraphicsEffect(self.opacity_effect)
@@ -507,10 +1153,18 @@ class VoiceConverterApp(QWidget):
         self.animation.start()
 
     def init_db(self):
-        """Initialize SQLite DB and create table if missing."""
+        """Initialize SQLite DB, creating/migrating tables unless the schema is already current."""
+        conn = sqlite3.connect(self.db_path)
         try:
-            conn = sqlite3.connect(self.db_path)
             c = conn.cursor()
+            c.execute('PRAGMA user_version')
+            if c.fetchone()[0] >= SCHEMA_VERSION:
+                return
+            # WAL is persistent: readers (admin dashboard, API server) no longer block on writes.
+            # It can't be switched inside a transaction, so set it before BEGIN.
+            c.execute("PRAGMA journal_mode=WAL")
+            # Whole migration in one transaction: a single commit, and all-or-nothing
+            c.execute('BEGIN')
             c.execute(
                 '''
                 CREATE TABLE IF NOT EXISTS transcripts (
@@ -524,7 +1178,6 @@ class VoiceConverterApp(QWidget):
                 )
                 '''
             )
-            conn.commit()
             # workers table for onboarding profiles
             c.execute(
                 '''
@@ -548,159 +1201,74 @@ class VoiceConverterApp(QWidget):
                 )
                 '''
             )
-            conn.commit()
             # Add missing columns if they don't exist (for existing databases)
+            c.execute("PRAGMA table_info(workers)")
+            columns = [row[1] for row in c.fetchall()]
+            
+            if 'phone_number' not in columns:
+                c.execute("ALTER TABLE workers ADD COLUMN phone_number TEXT")
+            
+            if 'profile_created' not in columns:
+                c.execute("ALTER TABLE workers ADD COLUMN profile_created INTEGER DEFAULT 0")
+                # Update existing records to have profile_created = 1 (they have profiles)
+                c.execute("UPDATE workers SET profile_created = 1 WHERE profile_created IS NULL OR profile_created = 0")
+            
+            # Written by the API server; added here too so both agree on SCHEMA_VERSION
+            if 'user_choice' not in columns:
+                c.execute("ALTER TABLE workers ADD COLUMN user_choice TEXT")
+            
+            # Index the login lookup (phone_number) so it is a B-tree probe, not a table scan
             try:
-                # Check if columns exist first
-                c.execute("PRAGMA table_info(workers)")
-                columns = [row[1] for row in c.fetchall()]
-                
-                if 'phone_number' not in columns:
-                    c.execute("ALTER TABLE workers ADD COLUMN phone_number TEXT")
-                    conn.commit()
-                
-                if 'profile_created' not in columns:
-                    c.execute("ALTER TABLE workers ADD COLUMN profile_created INTEGER DEFAULT 0")
-                    conn.commit()
-                    # Update existing records to have profile_created = 1 (they have profiles)
-                    c.execute("UPDATE workers SET profile_created = 1 WHERE profile_created IS NULL OR profile_created = 0")
-                    conn.commit()
-            except sqlite3.OperationalError as e:
-                # Column might already exist or other error
-                print(f"Note: {e}")
-                pass
+                c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_workers_phone ON workers(phone_number)")
+            except sqlite3.IntegrityError:
+                # Legacy databases may hold duplicate phone rows; index without the constraint
+                c.execute("CREATE INDEX IF NOT EXISTS idx_workers_phone ON workers(phone_number)")
+            c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            # Leave user_version untouched so the migration is retried next start
+            conn.rollback()
+            log.warning("Schema migration failed: %s", e)
         finally:
             conn.close()
 
+    def _open_db(self):
+        """Open the shared connection used by the app (guarded by self._db_lock)."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
+
     def _fallback_google_translate(self, text, src, tgt):
         """Use the unofficial Google Translate web API as a fallback.
         Returns translated text or raises on failure.
         """
-        try:
-            # build request to translate.googleapis.com
-            base = 'https://translate.googleapis.com/translate_a/single'
-            params = {
-                'client': 'gtx',
-                'sl': src,
-                'tl': tgt,
-                'dt': 't',
-                'q': text,
-            }
-            url = base + '?' + urllib.parse.urlencode(params)
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            # data[0] contains list of translation segments
-            parts = [seg[0] for seg in data[0] if seg and seg[0]]
-            return ''.join(parts)
-        except Exception as e:
-            raise
+        return _fallback_google_translate(text, src, tgt)
 
     def _is_suspicious_translation(self, src_text, translated_text):
-        """Detect obviously-broken translations: identical to source or many tiny-line fragments.
-        Returns True if translation looks bad.
-        """
-        if not translated_text:
-            return True
-        # identical or trivial
-        if translated_text.strip() == src_text.strip():
-            return True
-        # too short compared to source
-        if len(translated_text.strip()) < max(3, len(src_text.strip()) // 3):
-            return True
-        # multiple short lines or many single-letter tokens
-        lines = translated_text.splitlines()
-        short_lines = sum(1 for L in lines if len(L.strip()) <= 2)
-        if len(lines) >= 2 and short_lines >= len(lines) // 2:
-            return True
-        # suspicious repeated single-letter tokens
-        tokens = re.findall(r"\b\w\b", translated_text)
-        if len(tokens) >= 2:
-            # e.g., "s \n S \n Sinivas" produces single letters
-            return True
-        return False
+        """Returns True if translation looks bad (see module-level helper)."""
+        return _is_suspicious_translation(src_text, translated_text)
 
     def _contains_hindi(self, text):
-        try:
-            return bool(re.search(r'[\u0900-\u097F]', str(text or '')))
-        except Exception:
-            return False
+        return _contains_hindi(text)
 
     def _normalize_digits(self, text):
         """Convert Devanagari digits to ASCII and trim spaces inside digit groups."""
         if text is None:
             return ''
-        s = str(text)
-        # Map Devanagari digits to ASCII
-        trans = str.maketrans('०१२३४५६७८९', '0123456789')
-        s = s.translate(trans)
-        # Collapse spaces between digits like '1 2 3' -> '123' only for long digit runs
-        s = re.sub(r'(?<=\d)\s+(?=\d)', '', s)
-        return s
+        return _normalize_digits(str(text))
 
     def _translate_to_english(self, text, assumed_src=None):
         """Translate arbitrary text to English with fallback and heuristics."""
-        try:
-            src = assumed_src
-            if src is None:
-                src = 'hi' if self._contains_hindi(text) else 'en'
-            if src == 'en':
-                return text
-            # primary
-            try:
-                t = Translator(from_lang=src, to_lang='en').translate(text)
-            except Exception:
-                t = ''
-            if not t or self._is_suspicious_translation(str(text or ''), t):
-                try:
-                    t_fb = self._fallback_google_translate(str(text or ''), src, 'en')
-                    return t_fb or t or str(text or '')
-                except Exception:
-                    return t or str(text or '')
-            return t
-        except Exception:
-            return str(text or '')
+        return _translate_to_english(text, assumed_src)
 
     def _normalize_languages(self, text):
         """Normalize language list to canonical English names using fuzzy match."""
         if not text:
             return ''
-        canonical = [
-            'Hindi','English','Kannada','Telugu','Marathi','Bengali','Tamil','Gujarati',
-            'Urdu','Punjabi','Malayalam','Odia','Assamese','Konkani'
-        ]
-        # common confusions map
-        manual = {
-            'canada': 'Kannada',
-            'kanada': 'Kannada',
-            'kannad': 'Kannada',
-            'hinglish': 'English',
-            'eng': 'English',
-            'hin': 'Hindi',
-        }
-        tokens = re.split(r'[,\|/]+|\s{2,}', str(text))
-        out = []
-        for tok in tokens:
-            t = tok.strip()
-            if not t:
-                continue
-            lower = t.lower()
-            if lower in manual:
-                out.append(manual[lower])
-                continue
-            # fuzzy to canonical
-            match = difflib.get_close_matches(t, canonical, n=1, cutoff=0.75)
-            if not match:
-                match = difflib.get_close_matches(t.title(), canonical, n=1, cutoff=0.72)
-            out.append(match[0] if match else t)
-        # de-duplicate while preserving order
-        seen = set()
-        uniq = []
-        for l in out:
-            if l and l not in seen:
-                seen.add(l)
-                uniq.append(l)
-        return ' '.join(uniq)
+        return _normalize_languages(str(text))
 
     def _normalize_skill(self, text):
         """Map common Hindi/phonetic variants to English roles; otherwise return the cleaned English text."""
@@ -708,97 +1276,20 @@ class VoiceConverterApp(QWidget):
             return ''
         s = str(text).strip()
         # Translate to English if appears Hindi
-        if self._contains_hindi(s):
-            s = self._translate_to_english(s, assumed_src='hi')
-        lower = s.lower()
-        replacements = {
-            'vaidya': 'Doctor',
-            'vaidhya': 'Doctor',
-            'vaid': 'Doctor',
-            'vedya': 'Doctor',
-            'doctor': 'Doctor',
-            'physician': 'Doctor',
-            'plumber': 'Plumber',
-            'painter': 'Painter',
-            'carpenter': 'Carpenter',
-            'electrician': 'Electrician',
-            'software engineer': 'Software Engineer',
-            'driver': 'Driver',
-            'cook': 'Cook',
-            'chef': 'Cook',
-            'mason': 'Mason',
-        }
-        # choose best fuzzy match among keys
-        keys = list(replacements.keys())
-        match = difflib.get_close_matches(lower, keys, n=1, cutoff=0.8)
-        if match:
-            return replacements[match[0]]
-        # try looser cutoff
-        match = difflib.get_close_matches(lower, keys, n=1, cutoff=0.7)
-        if match:
-            return replacements[match[0]]
-        # Capitalize words
-        return ' '.join(w.capitalize() for w in s.split())
+        if _contains_hindi(s):
+            s = _translate_to_english(s, assumed_src='hi')
+        return _canonical_skill(s)
 
     def _normalize_gender(self, text):
         if not text:
             return ''
-        s = str(text).strip().lower()
-        mapping = {
-            'male': 'Male',
-            'man': 'Male',
-            'men': 'Male',
-            'female': 'Female',
-            'woman': 'Female',
-            'women': 'Female',
-            'पुरुष': 'Male',
-            'महिला': 'Female',
-        }
-        if s in mapping:
-            return mapping[s]
-        # fuzzy
-        match = difflib.get_close_matches(s, list(mapping.keys()), n=1, cutoff=0.8)
-        return mapping.get(match[0], s.capitalize() if s else '')
+        return _normalize_gender(str(text))
 
     def _parse_number_words(self, text):
         """Parse simple English/Hindi number words to digits. Returns string digits or ''."""
         if not text:
             return ''
-        s = str(text).strip().lower()
-        # Remove non-letter separators
-        s = re.sub(r'[^a-zA-Z\u0900-\u097F\s\-]', ' ', s)
-        tokens = s.split()
-        # Basic mappings up to 100 and common tens
-        en = {
-            'zero':0,'one':1,'two':2,'three':3,'four':4,'five':5,'six':6,'seven':7,'eight':8,'nine':9,
-            'ten':10,'eleven':11,'twelve':12,'thirteen':13,'fourteen':14,'fifteen':15,'sixteen':16,'seventeen':17,'eighteen':18,'nineteen':19,
-            'twenty':20,'thirty':30,'forty':40,'fifty':50,'sixty':60,'seventy':70,'eighty':80,'ninety':90,'hundred':100
-        }
-        hi = {
-            'शून्य':0,'एक':1,'दो':2,'तीन':3,'चार':4,'पांच':5,'पाँच':5,'छह':6,'सात':7,'आठ':8,'नौ':9,
-            'दस':10,'ग्यारह':11,'बारह':12,'तेरह':13,'चौदह':14,'पंद्रह':15,'सोलह':16,'सत्रह':17,'अठारह':18,'उन्नीस':19,
-            'बीस':20,'तीस':30,'चालीस':40,'पचास':50,'साठ':60,'सत्तर':70,'अस्सी':80,'नब्बे':90,'सौ':100
-        }
-        total = 0
-        current = 0
-        matched = False
-        for t in tokens:
-            if t in en:
-                val = en[t]
-                matched = True
-            elif t in hi:
-                val = hi[t]
-                matched = True
-            else:
-                continue
-            if val == 100:
-                current = max(1, current) * val
-            elif val >= 20 and val % 10 == 0:
-                current += val
-            else:
-                current += val
-        total += current
-        return str(total) if matched and total > 0 else ''
+        return _parse_number_words(str(text))
 
     # ----------------- Login flow -----------------
     def show_login(self):
@@ -846,22 +1337,12 @@ class VoiceConverterApp(QWidget):
         if not cfg:
             self.update_status('Select language direction')
             return
-        self.selected_src = cfg['src_code']
-        self.selected_tgt = cfg['tgt_code']
-        self.selected_recog = cfg['src_recog']
-
-        # questions with English and Hindi prompt texts (Aadhaar removed)
-        self.onboard_questions = [
-            {'key': 'name', 'en': 'What is your name?', 'hi': 'आपका नाम क्या है?'},
-            {'key': 'skill', 'en': 'What is your skill? (eg: plumber, painter)', 'hi': 'आपका कौशल क्या है? (जैसे: पलंबर, पेंटर)'},
-            {'key': 'education', 'en': 'What is your education level?', 'hi': 'आपकी शिक्षा क्या है?'},
-            {'key': 'age', 'en': 'What is your age?', 'hi': 'आपकी उम्र क्या है?'},
-            {'key': 'sex', 'en': 'What is your sex? (male/female)', 'hi': 'आपका लिंग क्या है? (पुरुष/महिला)'},
-            {'key': 'experience', 'en': 'How many years of experience?', 'hi': 'अनुभव के वर्षों की संख्या क्या है?'},
-            {'key': 'location', 'en': 'Which city or village are you from?', 'hi': 'आप किस शहर या गांव से हैं?'},
-            {'key': 'wage_expected', 'en': 'What is your expected daily wage?', 'hi': 'आपकी अपेक्षित दैनिक मजदूरी क्या है?'},
-            {'key': 'languages_known', 'en': 'Which languages do you know?', 'hi': 'आप किन भाषाओं को जानते हैं?'},
-        ]
+        self.selected_src = cfg.src_code
+        self.selected_tgt = cfg.tgt_code
+        self.selected_recog = cfg.src_recog
+
+        # shared, read-only question table
+        self.onboard_questions = self._ONBOARD_QUESTIONS
         self.onboard_answers = {}
         self.current_question_index = 0
         self.onboarding = True
@@ -875,21 +1356,42 @@ class VoiceConverterApp(QWidget):
             self.finish_onboarding()
             return
         q = self.onboard_questions[self.current_question_index]
-        # choose prompt language based on selected_src
-        prompt = q['hi'] if self.selected_src == 'hi' else q['en']
         # speak prompt then listen
-        self.speak_prompt_and_listen(prompt)
+        self.speak_prompt_and_listen(self._onboard_prompt(q, self.selected_src))
+
+    @staticmethod
+    def _onboard_prompt(q, src):
+        # choose prompt language based on the source language
+        return q['hi'] if src == 'hi' else q['en']
 
     def speak_prompt_and_listen(self, prompt_text):
-        # create TTS file and play; on playback end, start recognizer
+        # play the cached prompt audio (pre-generated at startup); on a cache miss
+        # synthesize it on the I/O pool so the UI stays responsive
+        fname = _tts_cache_path(self.audio_dir, prompt_text, self.selected_src)
+        if os.path.exists(fname):
+            self._play_prompt_and_listen(fname, '')
+        else:
+            self._submit_io(self._synthesize_prompt, prompt_text, self.selected_src)
+
+    def _submit_io(self, fn, *args):
+        """Run fn(*args) on the I/O pool, tracked so shutdown can wait for it."""
+        future = self._io_pool.submit(fn, *args)
+        self._io_futures.add(future)
+        future.add_done_callback(self._io_futures.discard)
+        return future
+
+    def _synthesize_prompt(self, prompt_text, lang):
+        # runs on the I/O pool
         try:
-            tts = gTTS(prompt_text, lang=self.selected_src)
-            fname = os.path.join(self.audio_dir, f"onboard_prompt_{int(datetime.utcnow().timestamp())}.mp3")
-            tts.save(fname)
+            self.prompt_audio_ready.emit(_cached_tts(self.audio_dir, prompt_text, lang), '')
         except Exception as e:
-            self.update_status(f"TTS failed: {e}")
+            self.prompt_audio_ready.emit('', f"TTS failed: {e}")
+
+    def _play_prompt_and_listen(self, fname, error):
+        # on playback end, start recognizer
+        if error:
             # still proceed to listen
-            fname = None
+            self.update_status(error)
 
         if fname:
             # connect a one-shot handler to start listening when playback ends
@@ -914,31 +1416,8 @@ class VoiceConverterApp(QWidget):
             self.start_onboard_recognition()
 
     def start_onboard_recognition(self):
-        # start a recognition thread for onboarding
-        # ensure any previous thread is stopped before creating new one
-        try:
-            if hasattr(self, 'recognition_thread') and self.recognition_thread is not None:
-                if self.recognition_thread.isRunning():
-                    try:
-                        self.recognition_thread.terminate()
-                    except Exception:
-                        pass
-                    try:
-                        self.recognition_thread.wait(500)
-                    except Exception:
-                        pass
-                try:
-                    self.recognition_thread.deleteLater()
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        self.recognition_thread = SpeechRecognitionThread(sr.Recognizer(), language=self.selected_recog)
-        self.recognition_thread.recognition_result.connect(self.handle_onboard_answer)
-        self.recognition_thread.status_signal.connect(self.update_status)
-        self.recognition_thread.finished.connect(self.on_recognition_finished)
-        self.recognition_thread.start()
+        # listen for the answer on the session's recognition thread
+        self._listen(self.handle_onboard_answer)
 
     def handle_onboard_answer(self, text):
         # store answer for current question
@@ -947,7 +1426,7 @@ class VoiceConverterApp(QWidget):
         except Exception:
             return
         # normalize text
-        text_norm = '' if text is None else ' '.join(str(text).split())
+        text_norm = '' if text is None else _WS_RE.sub(' ', str(text)).strip()
 
         # if nothing recognized, allow a retry or move on after 2 attempts
         if not text_norm:
@@ -956,8 +1435,9 @@ class VoiceConverterApp(QWidget):
             if tries <= 2:
                 # retry same question: prompt again
                 self.update_status(f"Didn't catch that for {q['key']}. Retrying ({tries}/2)")
-                # ask the same question again after a short pause
-                QTimer.singleShot(500, self.ask_next_onboard_question)
+                # ask the same question again; the next listen only starts when the
+                # prompt's playback ends, so no settling delay is needed
+                self.ask_next_onboard_question()
                 return
             else:
                 # record empty answer and move on
@@ -978,8 +1458,8 @@ class VoiceConverterApp(QWidget):
         self.onboard_answers[q['key']] = text_norm
         self.update_status(f"Captured answer for {q['key']}")
         self.current_question_index += 1
-        # small pause then ask next using QTimer
-        QTimer.singleShot(300, self.ask_next_onboard_question)
+        # ask next right away (prompt audio is cached; listening starts at EndOfMedia)
+        self.ask_next_onboard_question()
 
     def finish_onboarding(self):
         # Persist worker record directly using normalization pipeline (no dialog)
@@ -990,23 +1470,22 @@ class VoiceConverterApp(QWidget):
                 self.onboarding = False
                 return
             
-            conn = sqlite3.connect(self.db_path)
-            c = conn.cursor()
-            
-            # Check if phone number already exists
-            c.execute('SELECT id, profile_created FROM workers WHERE phone_number = ?', (self.onboard_phone,))
-            existing = c.fetchone()
-            
             raw = json.dumps(self.onboard_answers, ensure_ascii=False)
             # Translate and normalize to English for storage
             ans = dict(self.onboard_answers)
-            for k in ['name','education','sex','location','languages_known']:
-                ans[k] = self._translate_to_english(ans.get(k))
+            keys = ['name','education','sex','location','languages_known']
+            for k, v in zip(keys, _translate_batch_to_english([ans.get(k) for k in keys])):
+                ans[k] = v
             ans['skill'] = self._normalize_skill(ans.get('skill'))
             ans['languages_known'] = self._normalize_languages(ans.get('languages_known'))
             ans['sex'] = self._normalize_gender(ans.get('sex'))
             # Numeric-like fields with robust parsing
             def _num_clean(v):
+                # already plain ASCII digits (the usual case after the early
+                # extraction in handle_onboard_answer): nothing to translate or parse
+                s = '' if v is None else str(v).strip()
+                if s.isascii() and s.isdigit():
+                    return s
                 d = self._normalize_digits(self._translate_to_english(v))
                 if not d:
                     d = self._parse_number_words(v)
@@ -1016,52 +1495,36 @@ class VoiceConverterApp(QWidget):
             ans['wage_expected'] = _num_clean(ans.get('wage_expected'))
             # Store Aadhaar as raw string value (no normalization)
             ans['aadhaar'] = str(ans.get('aadhaar', '')).strip()
+            # low-cardinality values repeat across workers; share one string object each
+            for k in _LOW_CARD_FIELDS:
+                if isinstance(ans.get(k), str):
+                    ans[k] = sys.intern(ans[k])
             ts = datetime.utcnow().isoformat()
-            
-            if existing:
-                # Phone exists - update the profile and set profile_created = 1
-                worker_id = existing[0]
-                c.execute('''UPDATE workers SET 
-                    timestamp = ?, profile_created = 1, name = ?, skill = ?, education = ?, age = ?, 
-                    sex = ?, experience = ?, location = ?, aadhaar = ?, wage_expected = ?, 
-                    languages_known = ?, raw_answers = ?, audio_path = ?
-                    WHERE id = ?''',
-                    (ts,
-                     ans.get('name'),
-                     ans.get('skill'),
-                     ans.get('education'),
-                     ans.get('age'),
-                     ans.get('sex'),
-                     ans.get('experience'),
-                     ans.get('location'),
-                     ans.get('aadhaar'),
-                     ans.get('wage_expected'),
-                     ans.get('languages_known'),
-                     raw,
-                     None,
-                     worker_id
-                     ))
-            else:
-                # New phone number - insert with profile_created = 1
-                c.execute('INSERT INTO workers (timestamp, phone_number, profile_created, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known, raw_answers, audio_path) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)',
-                          (ts,
-                           self.onboard_phone,  # Phone number from login
-                           1,  # profile_created = 1
-                           ans.get('name'),
-                           ans.get('skill'),
-                           ans.get('education'),
-                           ans.get('age'),
-                           ans.get('sex'),
-                           ans.get('experience'),
-                           ans.get('location'),
-                           ans.get('aadhaar'),
-                           ans.get('wage_expected'),
-                           ans.get('languages_known'),
-                           raw,
-                           None
-                           ))
-            conn.commit()
-            conn.close()
+            profile = (ans.get('name'),
+                       ans.get('skill'),
+                       ans.get('education'),
+                       ans.get('age'),
+                       ans.get('sex'),
+                       ans.get('experience'),
+                       ans.get('location'),
+                       ans.get('aadhaar'),
+                       ans.get('wage_expected'),
+                       ans.get('languages_known'),
+                       raw,
+                       None)
+
+            # Translation/normalization is done; hold the DB only for a single
+            # transaction covering the lookup and the write (one commit)
+            with self._db_lock, self._conn as conn:
+                # Check if phone number already exists
+                existing = conn.execute('SELECT id, profile_created FROM workers WHERE phone_number = ?',
+                                        (self.onboard_phone,)).fetchone()
+                if existing:
+                    # Phone exists - update the profile and set profile_created = 1
+                    conn.execute(self._UPDATE_WORKER_SQL, (ts,) + profile + (existing[0],))
+                else:
+                    # New phone number - insert with profile_created = 1
+                    conn.execute(self._INSERT_WORKER_SQL, (ts, self.onboard_phone, 1) + profile)
             self.update_status(f'Onboarding complete and saved for {self.onboard_phone}')
         except sqlite3.IntegrityError as e:
             self.update_status(f'Phone number already exists. Please login instead.')
@@ -1077,156 +1540,151 @@ class VoiceConverterApp(QWidget):
         dlg.setGeometry(150, 150, 1000, 600)
         layout = QVBoxLayout()
 
-        table = QTableWidget()
-        # Remove ID column from display; keep it internally for actions
-        cols = ['Phone','Name','Skill Type','Education','Age','Gender','Experience','Location','Aadhaar','Wage','Languages','Actions']
-        table.setColumnCount(len(cols))
-        table.setHorizontalHeaderLabels(cols)
+        # Rows are held in a model and painted on demand; the ID stays in the
+        # model for actions but is not displayed
+        table = QTableView()
+        model = WorkerTableModel(table)
+        table.setModel(model)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SingleSelection)
+
+        def display_value(disp_i, val):
+            # Ensure English-only display; translate if Hindi detected
+            if isinstance(val, str) and self._contains_hindi(val):
+                val = self._translate_to_english(val, assumed_src='hi')
+            # Normalize numeric-like columns for display
+            # display indices: 4=Age, 6=Experience, 9=Wage (shifted by 1 for phone)
+            # Aadhaar (index 8) is stored as string, no normalization needed
+            if disp_i in (4, 6, 9):
+                val = self._normalize_digits(val)
+            # Normalize languages column for display (index 10 before actions)
+            if disp_i == 10:
+                val = self._normalize_languages(val)
+            # Normalize skill column (index 2, after phone and name)
+            if disp_i == 2:
+                val = self._normalize_skill(val)
+            # Normalize gender column (index 5, after age)
+            if disp_i == 5:
+                val = self._normalize_gender(val)
+            val = str(val or '')
+            # skill/gender/education/location/languages repeat across reloads too
+            return sys.intern(val) if disp_i in _LOW_CARD_DISPLAY_COLS else val
 
         def load_rows():
             try:
-                conn = sqlite3.connect(self.db_path)
-                c = conn.cursor()
-                c.execute('SELECT id, phone_number, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known FROM workers ORDER BY id DESC')
-                rows = c.fetchall()
-                conn.close()
+                with self._db_lock:
+                    rows = self._conn.execute('SELECT id, phone_number, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known FROM workers ORDER BY id DESC').fetchall()
             except Exception as e:
                 rows = []
                 self.update_status(f'Failed to load workers: {e}')
 
-            table.setRowCount(len(rows))
-            for r_i, r in enumerate(rows):
-                worker_id = r[0]
-                # place display columns (skip id at index 0, phone_number is at index 1)
-                # Display: phone_number, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known
-                for disp_i in range(11):
-                    val = r[disp_i + 1]  # Skip id (index 0)
-                    # Ensure English-only display; translate if Hindi detected
-                    if isinstance(val, str) and self._contains_hindi(val):
-                        val = self._translate_to_english(val, assumed_src='hi')
-                    # Normalize numeric-like columns for display
-                    # display indices: 4=Age, 6=Experience, 9=Wage (shifted by 1 for phone)
-                    # Aadhaar (index 8) is stored as string, no normalization needed
-                    if disp_i in (4, 6, 9):
-                        val = self._normalize_digits(val)
-                    # Normalize languages column for display (index 10 before actions)
-                    if disp_i == 10:
-                        val = self._normalize_languages(val)
-                    # Normalize skill column (index 2, after phone and name)
-                    if disp_i == 2:
-                        val = self._normalize_skill(val)
-                    # Normalize gender column (index 5, after age)
-                    if disp_i == 5:
-                        val = self._normalize_gender(val)
-                    item = QTableWidgetItem(str(val or ''))
-                    table.setItem(r_i, disp_i, item)
-
-                # actions
-                action_w = QWidget()
-                ah = QHBoxLayout()
-                ah.setContentsMargins(0,0,0,0)
-                edit_btn = QPushButton('Edit')
-                del_btn = QPushButton('Delete')
-
-                def make_edit_fn(worker_id):
-                    def _edit():
-                        # open simple edit dialog
-                        dlg_e = QDialog(dlg)
-                        dlg_e.setWindowTitle(f'Edit Worker {worker_id}')
-                        form = QVBoxLayout()
-                        fields = {}
-                        labels = ['phone_number','name','skill','education','age','sex','experience','location','aadhaar','wage_expected','languages_known']
-                        try:
-                            conn = sqlite3.connect(self.db_path)
-                            c = conn.cursor()
-                            c.execute('SELECT '+','.join(labels)+' FROM workers WHERE id=?',(worker_id,))
-                            row = c.fetchone()
-                            conn.close()
-                        except Exception as e:
-                            self.update_status(f'Load for edit failed: {e}')
-                            return
-                        for i,lab in enumerate(labels):
-                            le = QLineEdit()
-                            le.setText(str(row[i] or ''))
-                            if lab == 'phone_number':
-                                le.setReadOnly(True)  # Don't allow phone number changes
-                            form.addWidget(QLabel(lab.capitalize()))
-                            form.addWidget(le)
-                            fields[lab]=le
-
-                        btn_save = QPushButton('Save')
-                        def _save():
-                            try:
-                                vals = [fields[l].text() for l in labels]
-                                conn = sqlite3.connect(self.db_path)
-                                c = conn.cursor()
-                                q = 'UPDATE workers SET ' + ','.join([f"{l}=?" for l in labels]) + ' WHERE id=?'
-                                c.execute(q, vals+[worker_id])
-                                conn.commit()
-                                conn.close()
-                                dlg_e.accept()
-                                load_rows()
-                                self.update_status('Worker updated')
-                            except Exception as e:
-                                QMessageBox.warning(dlg_e, 'Error', f'Update failed: {e}')
-
-                        btn_save.clicked.connect(_save)
-                        form.addWidget(btn_save)
-                        dlg_e.setLayout(form)
-                        dlg_e.exec_()
-                    return _edit
-
-                def make_del_fn(worker_id, row_index):
-                    def _del():
-                        if QMessageBox.question(dlg, 'Confirm', f'Delete worker {worker_id}?')!=QMessageBox.Yes:
-                            return
-                        try:
-                            conn = sqlite3.connect(self.db_path)
-                            c = conn.cursor()
-                            c.execute('DELETE FROM workers WHERE id=?',(worker_id,))
-                            conn.commit()
-                            conn.close()
-                            load_rows()
-                            self.update_status('Worker deleted')
-                        except Exception as e:
-                            QMessageBox.warning(dlg, 'Error', f'Delete failed: {e}')
-                    return _del
-
-                edit_btn.clicked.connect(make_edit_fn(r[0]))
-                del_btn.clicked.connect(make_del_fn(r[0], r_i))
-
-                ah.addWidget(edit_btn)
-                ah.addWidget(del_btn)
-                action_w.setLayout(ah)
-                table.setCellWidget(r_i, 11, action_w)  # Actions column is now at index 11
-
+            # Normalize each distinct value once per column (skills, genders and
+            # languages repeat heavily across workers), then fill cells by lookup
+            display = [{} for _ in range(11)]
+            for disp_i, col_map in enumerate(display):
+                for r in rows:
+                    val = r[disp_i + 1]
+                    if val not in col_map:
+                        col_map[val] = display_value(disp_i, val)
+
+            # Display: phone_number, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known
+            model.set_rows([r[0] for r in rows],
+                           [tuple(display[disp_i][r[disp_i + 1]] for disp_i in range(11)) for r in rows])
             table.resizeColumnsToContents()
 
+        def edit_worker(worker_id):
+            # open simple edit dialog
+            dlg_e = QDialog(dlg)
+            dlg_e.setWindowTitle(f'Edit Worker {worker_id}')
+            form = QVBoxLayout()
+            fields = {}
+            labels = self._EDIT_COLS
+            try:
+                with self._db_lock:
+                    row = self._conn.execute(self._SELECT_EDIT_SQL,(worker_id,)).fetchone()
+            except Exception as e:
+                self.update_status(f'Load for edit failed: {e}')
+                return
+            for i,lab in enumerate(labels):
+                le = QLineEdit()
+                le.setText(str(row[i] or ''))
+                if lab == 'phone_number':
+                    le.setReadOnly(True)  # Don't allow phone number changes
+                form.addWidget(QLabel(lab.capitalize()))
+                form.addWidget(le)
+                fields[lab]=le
+
+            btn_save = QPushButton('Save')
+            def _save():
+                try:
+                    vals = [fields[l].text() for l in labels]
+                    with self._db_lock, self._conn as conn:
+                        conn.execute(self._UPDATE_EDIT_SQL, vals+[worker_id])
+                    dlg_e.accept()
+                    load_rows()
+                    self.update_status('Worker updated')
+                except Exception as e:
+                    QMessageBox.warning(dlg_e, 'Error', f'Update failed: {e}')
+
+            btn_save.clicked.connect(_save)
+            form.addWidget(btn_save)
+            dlg_e.setLayout(form)
+            dlg_e.exec_()
+
+        def delete_worker(worker_id):
+            if QMessageBox.question(dlg, 'Confirm', f'Delete worker {worker_id}?')!=QMessageBox.Yes:
+                return
+            try:
+                with self._db_lock, self._conn as conn:
+                    conn.execute('DELETE FROM workers WHERE id=?',(worker_id,))
+                load_rows()
+                self.update_status('Worker deleted')
+            except Exception as e:
+                QMessageBox.warning(dlg, 'Error', f'Delete failed: {e}')
+
+        # actions: right-click menu (double-click edits) instead of a button widget per row
+        def show_row_menu(pos):
+            index = table.indexAt(pos)
+            if not index.isValid():
+                return
+            worker_id = model.worker_id(index.row())
+            menu = QMenu(table)
+            menu.addAction('Edit', lambda: edit_worker(worker_id))
+            menu.addAction('Delete', lambda: delete_worker(worker_id))
+            menu.exec_(table.viewport().mapToGlobal(pos))
+
+        table.setContextMenuPolicy(Qt.CustomContextMenu)
+        table.customContextMenuRequested.connect(show_row_menu)
+        table.doubleClicked.connect(lambda index: edit_worker(model.worker_id(index.row())))
+
         load_rows()
 
+        layout.addWidget(QLabel('Right-click a worker to edit or delete; double-click to edit.'))
         layout.addWidget(table)
 
-        # export CSV
+        # export CSV; the raw (often Hindi) answer JSON is only read when asked for
+        raw_cb = QCheckBox('Include raw answers')
         exp_btn = QPushButton('Export CSV')
         def _export():
             path, _ = QFileDialog.getSaveFileName(dlg, 'Save CSV', 'workers_export.csv', 'CSV Files (*.csv)')
             if path:
                 try:
-                    conn = sqlite3.connect(self.db_path)
-                    c = conn.cursor()
-                    c.execute('SELECT id, timestamp, phone_number, name, skill, education, age, sex, experience, location, aadhaar, wage_expected, languages_known, raw_answers FROM workers ORDER BY id')
-                    allrows = c.fetchall()
-                    conn.close()
                     import csv as _csv
+                    cols = ['id','timestamp','phone_number','name','skill','education','age','sex','experience','location','aadhaar','wage_expected','languages_known']
+                    if raw_cb.isChecked():
+                        cols.append('raw_answers')
                     with open(path, 'w', newline='', encoding='utf-8') as f:
                         writer = _csv.writer(f)
-                        writer.writerow(['id','timestamp','phone_number','name','skill','education','age','sex','experience','location','aadhaar','wage_expected','languages_known','raw_answers'])
-                        writer.writerows(allrows)
+                        writer.writerow(cols)
+                        # stream rows from the cursor instead of materializing them all
+                        with self._db_lock:
+                            writer.writerows(self._conn.execute('SELECT ' + ', '.join(cols) + ' FROM workers ORDER BY id'))
                     self.update_status('Exported CSV')
                 except Exception as e:
                     self.update_status(f'Export failed: {e}')
 
         exp_btn.clicked.connect(_export)
+        layout.addWidget(raw_cb)
         layout.addWidget(exp_btn)
 
         dlg.setLayout(layout)
@@ -1234,24 +1692,17 @@ class VoiceConverterApp(QWidget):
 
     def save_record(self, src_lang, tgt_lang, original_text, translated_text, audio_path=None):
         """Insert a transcript/translation record and return inserted id."""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
         ts = datetime.utcnow().isoformat()
-        c.execute(
-            'INSERT INTO transcripts (timestamp, src_lang, tgt_lang, original_text, translated_text, audio_path) VALUES (?,?,?,?,?,?)',
-            (ts, src_lang, tgt_lang, original_text, translated_text, audio_path),
-        )
-        conn.commit()
-        rowid = c.lastrowid
-        conn.close()
-        return rowid
+        with self._db_lock, self._conn as conn:
+            c = conn.execute(
+                'INSERT INTO transcripts (timestamp, src_lang, tgt_lang, original_text, translated_text, audio_path) VALUES (?,?,?,?,?,?)',
+                (ts, src_lang, tgt_lang, original_text, translated_text, audio_path),
+            )
+        return c.lastrowid
 
     def update_audio_path(self, record_id, audio_path):
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('UPDATE transcripts SET audio_path = ? WHERE id = ?', (audio_path, record_id))
-        conn.commit()
-        conn.close()
+        with self._db_lock, self._conn as conn:
+            conn.execute('UPDATE transcripts SET audio_path = ? WHERE id = ?', (audio_path, record_id))
 
     def start_recording(self):
         if not self.recording:
@@ -1262,39 +1713,17 @@ class VoiceConverterApp(QWidget):
             sel = self.language_dropdown.currentText()
             cfg = self.preset_langs.get(sel)
             if cfg:
-                self.selected_src = cfg['src_code']
-                self.selected_tgt = cfg['tgt_code']
-                self.selected_recog = cfg['src_recog']
-                
-                # Initialize a new recognizer with enhanced settings
-                recognizer = sr.Recognizer()
-                # Increase sensitivity for better word capture
-                recognizer.energy_threshold = 4000
-                recognizer.dynamic_energy_threshold = True
-                recognizer.pause_threshold = 0.8  # Shorter pause between phrases
-                recognizer.operation_timeout = 30  # Longer operation timeout
-                # Improve Hindi capture: don't cut off tails, tolerate brief pauses
-                try:
-                    recognizer.non_speaking_duration = 0.5
-                    recognizer.phrase_threshold = 0.3
-                except Exception:
-                    pass
-                
-                # Set translator with explicit source and target
-                self.translator = Translator(from_lang=self.selected_src, to_lang=self.selected_tgt)
-                
-                # Create a fresh recognition thread with improved recognizer
-                self.recognition_thread = SpeechRecognitionThread(recognizer, language=self.selected_recog)
-                self.recognition_thread.recognition_result.connect(self.translate_and_play)
-                self.recognition_thread.status_signal.connect(self.update_status)
-                self.recognition_thread.finished.connect(self.on_recognition_finished)
-                self.recognition_thread.start()
+                self.selected_src = cfg.src_code
+                self.selected_tgt = cfg.tgt_code
+                self.selected_recog = cfg.src_recog
+
+                self._listen(self.translate_and_play)
 
     def translate_and_play(self, text):
         self.update_status("Processing recognized text")
         
         # Clean up the text - remove extra whitespace and normalize
-        text = ' '.join(text.split())
+        text = _WS_RE.sub(' ', text).strip()
         if not text:
             self.update_status("No text was recognized")
             return
@@ -1302,30 +1731,33 @@ class VoiceConverterApp(QWidget):
         self.spoken_label.setPlainText('Spoken Text: ' + text)
         self.update_status("Translating text...")
         
-        # Try primary translation first
-        translator = Translator(from_lang=self.selected_src, to_lang=self.selected_tgt)
-        try:
-            translated_text = translator.translate(text)
-            if not translated_text:
-                raise Exception("Empty translation result")
-        except Exception as e:
-            self.update_status(f"Primary translation failed: {e}")
-            translated_text = ''
+        if (self.selected_src or '').lower() == (self.selected_tgt or '').lower():
+            # same language both ways: nothing to translate
+            translated_text = text
+        else:
+            # Try primary translation first
+            try:
+                translated_text = _get_translator(self.selected_src, self.selected_tgt).translate(text)
+                if not translated_text:
+                    raise Exception("Empty translation result")
+            except Exception as e:
+                self.update_status(f"Primary translation failed: {e}")
+                translated_text = ''
 
-        # If the translation looks suspicious, fallback to the Google web API
-        try:
-            if self._is_suspicious_translation(text, translated_text):
-                self.update_status("Primary translation looks suspicious; using fallback translator")
-                try:
-                    translated_text_fb = self._fallback_google_translate(text, self.selected_src, self.selected_tgt)
-                    if translated_text_fb:
-                        translated_text = translated_text_fb
-                except Exception:
-                    # if fallback fails, keep the best we have
-                    pass
-        except Exception:
-            # safety: don't let heuristic errors block flow
-            pass
+            # If the translation looks suspicious, fallback to the Google web API
+            try:
+                if self._is_suspicious_translation(text, translated_text):
+                    self.update_status("Primary translation looks suspicious; using fallback translator")
+                    try:
+                        translated_text_fb = self._fallback_google_translate(text, self.selected_src, self.selected_tgt)
+                        if translated_text_fb:
+                            translated_text = translated_text_fb
+                    except Exception:
+                        # if fallback fails, keep the best we have
+                        pass
+            except Exception:
+                # safety: don't let heuristic errors block flow
+                pass
 
         self.update_status("Text translated")
 
@@ -1346,7 +1778,7 @@ class VoiceConverterApp(QWidget):
             else:
                 # Force translate to English
                 try:
-                    en_primary = Translator(from_lang=self.selected_src, to_lang='en').translate(text)
+                    en_primary = _get_translator(self.selected_src, 'en').translate(text)
                 except Exception:
                     en_primary = ''
                 if not en_primary or self._is_suspicious_translation(text, en_primary):
@@ -1365,96 +1797,93 @@ class VoiceConverterApp(QWidget):
         self.player.setMedia(QMediaContent())
 
         self.update_status("Saving audio file")
-        # save TTS of translated text
+        # TTS and the DB record are written on the I/O pool; playback starts
+        # in _play_translation once the file exists
+        self._submit_io(self._synthesize_and_save, translated_text,
+                        self.selected_src, self.selected_tgt, text, save_text_en)
+
+    def _synthesize_and_save(self, translated_text, src, tgt, original_text, save_text_en):
+        # runs on the I/O pool
+        errors = []
+        # save TTS of translated text; a phrase already spoken in this language
+        # reuses its file instead of another gTTS round-trip
         try:
-            tts = gTTS(translated_text, lang=self.selected_tgt)
-            # unique name per translation
-            ts = int(datetime.utcnow().timestamp())
-            dir_tag = f"{self.selected_src or 'src'}_to_{self.selected_tgt or 'tgt'}"
-            safe_tag = re.sub(r'[^a-zA-Z0-9_]+', '_', dir_tag)
-            tmp_audio = os.path.join(self.audio_dir, f"translated_{safe_tag}_{ts}.mp3")
-            tts.save(tmp_audio)
+            dir_tag = f"{src or 'src'}_to_{tgt or 'tgt'}"
+            safe_tag = _SAFE_TAG_RE.sub('_', dir_tag)
+            tmp_audio = _cached_tts(self.audio_dir, translated_text, tgt, prefix=f"translated_{safe_tag}")
         except Exception as e:
-            self.update_status(f"TTS save failed: {e}")
+            errors.append(f"TTS save failed: {e}")
             tmp_audio = None
-        self.update_status("Audio file saved")
-
-    # download button removed; continue
-
-        self.update_status("Playing audio")
-        self.player.setMedia(
-            QMediaContent(
-                QUrl.fromLocalFile(
-                    tmp_audio if tmp_audio else ""
-                )
-            )
-        )
-        self.player.play()
-        self.update_status("Audio played")
 
         # Save record to DB
         try:
             audio_path = os.path.abspath(tmp_audio) if tmp_audio else None
             # Save English-only translated text per requirement
-            self.save_record(self.selected_src, self.selected_tgt, text, save_text_en, audio_path)
+            self.save_record(src, tgt, original_text, save_text_en, audio_path)
         except Exception as e:
-            self.update_status(f"DB save failed: {e}")
-
-    def on_recognition_finished(self):
-        self.recognition_thread.deleteLater()
+            errors.append(f"DB save failed: {e}")
+        self.translation_audio_ready.emit(tmp_audio or '', '; '.join(errors))
 
-        # prepare a fresh thread for next recording using same recognition locale
-        self.recognition_thread = SpeechRecognitionThread(sr.Recognizer(), language=self.selected_recog)
-        self.recognition_thread.recognition_result.connect(self.translate_and_play)
-        self.recognition_thread.status_signal.connect(self.update_status)
-        self.recognition_thread.finished.connect(self.on_recognition_finished)
+    def _play_translation(self, audio_path, error):
+        if error:
+            self.update_status(error)
+        if not audio_path:
+            return
+        self.update_status("Playing audio")
+        self.player.setMedia(QMediaContent(QUrl.fromLocalFile(audio_path)))
+        self.player.play()
+        self.update_status("Audio played")
 
+    def on_recognition_finished(self):
         self.recording = False
         self.start_button.setEnabled(True)
 
     def closeEvent(self, event):
-        # Attempt graceful shutdown of running threads and player
         try:
-            try:
-                if hasattr(self, 'recognition_thread') and self.recognition_thread.isRunning():
-                    # best-effort terminate the thread to avoid Qt warnings on exit
-                    try:
-                        self.recognition_thread.terminate()
-                    except Exception:
-                        pass
-                    try:
-                        self.recognition_thread.wait(1000)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            try:
-                if hasattr(self, 'player'):
-                    self.player.stop()
-            except Exception:
-                pass
+            self._shutdown_threads()
         finally:
             event.accept()
 
+    @staticmethod
+    def _stop_thread(thread, name):
+        """Wait up to SHUTDOWN_WAIT_MS for thread to finish; terminate it as a last resort.
+
+        Returns True once the thread is no longer running.
+        """
+        thread.requestInterruption()
+        thread.quit()
+        if thread.wait(SHUTDOWN_WAIT_MS):
+            return True
+        # terminate() can kill the thread mid-call (e.g. inside PyAudio or a
+        # gTTS request); it is only reached when the worker ignored the stop request
+        log.warning("%s did not stop within %d ms; terminating it", name, SHUTDOWN_WAIT_MS)
+        thread.terminate()
+        return thread.wait(500)
+
     def _shutdown_threads(self):
-        # Best-effort stop/terminate running threads and stop player
+        # Best-effort stop of running threads, player, pool, DB and microphone.
+        # Reached from both closeEvent and aboutToQuit; only the first call acts.
+        # Every wait is bounded, and a resource is only closed once the workers
+        # using it have stopped; otherwise it is left for process exit to reclaim.
+        if getattr(self, '_shut_down', False):
+            return
+        self._shut_down = True
+        try:
+            pre = getattr(self, '_prompt_audio_thread', None)
+            if pre is not None and pre.isRunning():
+                # stops after the prompt currently being synthesized
+                self._stop_thread(pre, "Prompt audio thread")
+        except Exception:
+            pass
+        recognition_stopped = True
         try:
             thr = getattr(self, 'recognition_thread', None)
             if thr is not None and thr.isRunning():
-                try:
-                    thr.quit()
-                except Exception:
-                    pass
-                try:
-                    thr.terminate()
-                except Exception:
-                    pass
-                try:
-                    thr.wait(1000)
-                except Exception:
-                    pass
+                # an utterance in progress finishes first (listen() and the recognizer time out)
+                thr.stop()
+                recognition_stopped = self._stop_thread(thr, "Recognition thread")
         except Exception:
-            pass
+            recognition_stopped = False
         try:
             player = getattr(self, 'player', None)
             if player is not None:
@@ -1464,6 +1893,33 @@ class VoiceConverterApp(QWidget):
                     pass
         except Exception:
             pass
+        io_stopped = True
+        try:
+            pool = getattr(self, '_io_pool', None)
+            if pool is not None:
+                # drop queued TTS/DB jobs and give the running ones a bounded wait
+                pool.shutdown(wait=False, cancel_futures=True)
+                _, running = wait_futures(list(self._io_futures), timeout=SHUTDOWN_WAIT_MS / 1000)
+                if running:
+                    log.warning("%d I/O job(s) still running at shutdown", len(running))
+                    io_stopped = False
+        except Exception:
+            io_stopped = False
+        try:
+            conn = getattr(self, '_conn', None)
+            if conn is not None and io_stopped:
+                with self._db_lock:
+                    conn.close()
+        except Exception:
+            pass
+        try:
+            # release the session microphone once nothing is reading from it
+            mic = getattr(self, '_mic', None)
+            if mic is not None and recognition_stopped:
+                self._mic = self._mic_source = None
+                mic.__exit__(None, None, None)
+        except Exception:
+            pass
 
     def update_status(self, status):
         self.status_bar.showMessage(status)
@@ -1471,6 +1927,8 @@ class VoiceConverterApp(QWidget):
 
 
 if __name__ == '__main__':
+    # DEBUG output (login/profile checks) is filtered out unless the level is lowered
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s %(name)s: %(message)s')
     app = QApplication(sys.argv)
     converter_app = VoiceConverterApp()
     # Don't show immediately - login dialog will handle visibility
@@ -22,7 +22,7 @@ except ModuleNotFoundError:
     except ImportError:
         pass
 
-import requests
+from api_session import SESSION
 
 BASE_URL = "http://localhost:5000/api"
 
@@ -30,7 +30,7 @@ def test_health():
     """Test health check endpoint"""
     print("\n1. Testing Health Check...")
     try:
-        r = requests.get(f"{BASE_URL}/health")
+        r = SESSION.get(f"{BASE_URL}/health")
         print(f"   Status: {r.status_code}")
         print(f"   Response: {json.dumps(r.json(), indent=2)}")
         return True
@@ -46,7 +46,7 @@ def test_verify_otp():
             "phone_number": "9876543210",
             "otp": "123456"
         }
-        r = requests.post(f"{BASE_URL}/auth/verify-otp", json=data)
+        r = SESSION.post(f"{BASE_URL}/auth/verify-otp", json=data)
         print(f"   Status: {r.status_code}")
         response = r.json()
         print(f"   Response: {json.dumps(response, indent=2)}")
@@ -63,7 +63,7 @@ def test_user_choice_question(token):
     print("\n3. Testing Get User Choice Question...")
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        r = requests.get(f"{BASE_URL}/auth/user-choice/question?language=en", headers=headers)
+        r = SESSION.get(f"{BASE_URL}/auth/user-choice/question?language=en", headers=headers)
         print(f"   Status: {r.status_code}")
         response = r.json()
         print(f"   Question Text: {response.get('question_text', 'N/A')}")
@@ -84,7 +84,7 @@ def test_save_user_choice(token):
         data = {
             "voice_text": "I want to apply for job"
         }
-        r = requests.post(f"{BASE_URL}/auth/user-choice", json=data, headers=headers)
+        r = SESSION.post(f"{BASE_URL}/auth/user-choice", json=data, headers=headers)
         print(f"   Status: {r.status_code}")
         response = r.json()
         print(f"   Response: {json.dumps(response, indent=2)}")
@@ -93,15 +93,36 @@ def test_save_user_choice(token):
         print(f"   Error: {e}")
         return None
 
+def test_save_onboarding_answers(token):
+    """Test saving several onboarding answers in one request"""
+    print("\n5. Testing Batch Onboarding Answers...")
+    try:
+        headers = {"Authorization": f"Bearer {token}"}
+        data = {
+            "answers": [
+                {"question_key": "name", "answer_text": "Test Worker"},
+                {"question_key": "skill", "answer_text": "plumber"},
+                {"question_key": "location", "answer_text": "Mumbai"}
+            ]
+        }
+        r = SESSION.post(f"{BASE_URL}/onboarding/answers", json=data, headers=headers)
+        print(f"   Status: {r.status_code}")
+        response = r.json()
+        print(f"   Response: {json.dumps(response, indent=2, ensure_ascii=False)}")
+        return response.get('saved')
+    except Exception as e:
+        print(f"   Error: {e}")
+        return None
+
 def test_verify_otp_again():
     """Test verify OTP again to see if user_choice is included"""
-    print("\n5. Testing Verify OTP Again (should include user_choice)...")
+    print("\n6. Testing Verify OTP Again (should include user_choice)...")
     try:
         data = {
             "phone_number": "9876543210",
             "otp": "999999"
         }
-        r = requests.post(f"{BASE_URL}/auth/verify-otp", json=data)
+        r = SESSION.post(f"{BASE_URL}/auth/verify-otp", json=data)
         print(f"   Status: {r.status_code}")
         response = r.json()
         print(f"   Response: {json.dumps(response, indent=2)}")
@@ -135,7 +156,12 @@ if __name__ == "__main__":
     if choice:
         print(f"\n✓ User choice saved: {choice}")
     
-    # Test 5: Verify OTP again (should include user_choice)
+    # Test 5: Batch onboarding answers
+    saved = test_save_onboarding_answers(token)
+    if saved:
+        print(f"\n✓ Onboarding answers saved: {saved}")
+    
+    # Test 6: Verify OTP again (should include user_choice)
     test_verify_otp_again()
     
     print("\n" + "=" * 60)
@@ -0,0 +1,18 @@
+"""Regression tests for language-list normalization in main.py"""
+import pytest
+
+# main.py imports PyQt5, speech_recognition, gTTS and translate at module level
+main = pytest.importorskip('main')
+
+
+def test_misspelling_maps_to_closest_language():
+    assert main._normalize_languages('Bengli') == 'Bengali'
+
+
+def test_exact_and_manual_names():
+    assert main._normalize_languages('hindi, Canada') == 'Hindi Kannada'
+
+
+@pytest.mark.parametrize('junk', ['xurdu', 'codia'])
+def test_junk_token_is_kept_as_typed(junk):
+    assert main._normalize_languages(junk) == junk
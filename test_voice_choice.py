@@ -7,10 +7,22 @@ Tests the POST /api/auth/user-choice/recognize endpoint
 import requests
 import os
 import sys
+from itertools import islice
+from pathlib import Path
+
+from api_session import SESSION
+
+# Optional: stream the upload from disk instead of buffering the whole file
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
 
 # API base URL
 BASE_URL = "http://localhost:5000"
 
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.flac', '.aiff')
+
 def test_voice_choice():
     """Test the voice choice recognition endpoint"""
     
@@ -28,7 +40,7 @@ def test_voice_choice():
     if not otp:
         otp = "123456"
     
-    verify_response = requests.post(
+    verify_response = SESSION.post(
         f"{BASE_URL}/api/auth/verify-otp",
         json={
             "phone_number": phone_number,
@@ -46,7 +58,7 @@ def test_voice_choice():
     
     # Step 2: Get user choice question (optional - just to see the flow)
     print("\n2. Getting user choice question...")
-    question_response = requests.get(
+    question_response = SESSION.get(
         f"{BASE_URL}/api/auth/user-choice/question",
         headers={"Authorization": f"Bearer {token}"},
         params={"language": "en"}
@@ -61,12 +73,12 @@ def test_voice_choice():
     print("\n3. Testing voice recognition with audio file...")
     print("   Looking for test audio files...")
     
-    # Look for audio files in the project
-    audio_files = []
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            if file.endswith(('.wav', '.mp3', '.flac', '.aiff')):
-                audio_files.append(os.path.join(root, file))
+    # Look for audio files in the project; only the first 5 are offered
+    audio_files = [
+        str(path) for path in islice(
+            (p for p in Path('.').rglob('*') if p.suffix in AUDIO_EXTENSIONS), 5
+        )
+    ]
     
     if not audio_files:
         print("❌ No audio files found in the project.")
@@ -77,11 +89,11 @@ def test_voice_choice():
             return
     else:
         print(f"   Found {len(audio_files)} audio file(s):")
-        for i, af in enumerate(audio_files[:5], 1):
+        for i, af in enumerate(audio_files, 1):
             print(f"   {i}. {af}")
         
-        choice = input(f"\n   Select audio file (1-{min(len(audio_files), 5)}) or enter custom path: ").strip()
-        if choice.isdigit() and 1 <= int(choice) <= min(len(audio_files), 5):
+        choice = input(f"\n   Select audio file (1-{len(audio_files)}) or enter custom path: ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(audio_files):
             audio_path = audio_files[int(choice) - 1]
         else:
             audio_path = choice if choice else audio_files[0]
@@ -94,24 +106,24 @@ def test_voice_choice():
     
     # Prepare multipart form data
     with open(audio_path, 'rb') as audio_file:
-        files = {
-            'audio': (os.path.basename(audio_path), audio_file, 'audio/wav')
-        }
-        data = {
-            'language': 'en-US'
-        }
+        audio_part = (os.path.basename(audio_path), audio_file, 'audio/wav')
         headers = {
             'Authorization': f'Bearer {token}'
         }
+        if MultipartEncoder is not None:
+            encoder = MultipartEncoder(fields={'audio': audio_part, 'language': 'en-US'})
+            headers['Content-Type'] = encoder.content_type
+            body = {'data': encoder}
+        else:
+            body = {'files': {'audio': audio_part}, 'data': {'language': 'en-US'}}
         
         print("   Sending audio file to backend...")
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{BASE_URL}/api/auth/user-choice/recognize",
                 headers=headers,
-                files=files,
-                data=data,
-                timeout=30
+                timeout=30,
+                **body
             )
             
             print(f"\n   Response Status: {response.status_code}")
@@ -145,7 +157,7 @@ def test_with_text_alternative():
     if not otp:
         otp = "123456"
     
-    verify_response = requests.post(
+    verify_response = SESSION.post(
         f"{BASE_URL}/api/auth/verify-otp",
         json={"phone_number": phone_number, "otp": otp}
     )
@@ -161,7 +173,7 @@ def test_with_text_alternative():
     if not voice_text:
         voice_text = "apply job"
     
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/api/auth/user-choice",
         headers={"Authorization": f"Bearer {token}"},
         json={"voice_text": voice_text}